@@ -2,12 +2,10 @@
 """Run ShadowDiff tests from command line."""
 
 import argparse
-import json
+import os
 import sys
 from pathlib import Path
 
-from shadowdiff import run_tests
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -42,6 +40,12 @@ Examples:
     parser.add_argument("-r", "--report", dest="report_named", help="Path to output report")
     parser.add_argument("-d", "--datasets", dest="datasets_named", help="Path to datasets folder")
     parser.add_argument("-q", "--quiet", action="store_true", help="Suppress console output")
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
@@ -67,6 +71,10 @@ Examples:
         print(f"Error: Datasets folder not found: {datasets_path}", file=sys.stderr)
         return 1
 
+    # Imported once the arguments check out, so --help and usage errors
+    # don't load the engine
+    from shadowdiff import run_tests
+
     # Run tests
     if not args.quiet:
         print(f"Schema: {schema_path}")
@@ -76,12 +84,13 @@ Examples:
     report = run_tests(
         schema_path=schema_path,
         test_folder=datasets_path,
-        print_report=not args.quiet
+        print_report=not args.quiet,
+        workers=max(1, args.workers)
     )
 
     # Save report
-    with open(report_path, 'w') as f:
-        json.dump(report.to_dict(), indent=2, fp=f)
+    with open(report_path, 'wb') as f:
+        report.write_json(f)
 
     if not args.quiet:
         print(f"\nReport saved to: {report_path}")
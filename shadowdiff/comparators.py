@@ -3,19 +3,42 @@
 from __future__ import annotations
 
 import re
+from array import array
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime
-from typing import Any, Optional
-from functools import lru_cache
+from math import isfinite
+from typing import Any, Callable, Optional, Tuple
 
-from .models import FieldRules
+from .models import FieldRules, MigrationStrategy, _freeze
 from .utils import parse_duration
 
 
-# Cache for compiled regex patterns
-@lru_cache(maxsize=256)
-def _compile_pattern(pattern: str) -> re.Pattern:
-    """Compile and cache a regex pattern."""
-    return re.compile(pattern)
+Comparator = Callable[[Any, Any], Tuple[bool, str]]
+
+# Most compiled comparators kept (least recently used ones are dropped
+# first); FieldRules keeps its own in _compare_fn, so only compile_rules
+# calls for new rule objects look here
+_COMPILED_CACHE_SIZE = 256
+
+# Compiled comparators keyed by the rule values that affect scalar comparison
+_compiled_comparators: OrderedDict[tuple, Comparator] = OrderedDict()
+
+# ISO 8601 strptime formats tried when fromisoformat fails
+_ISO_FORMATS: tuple[str, ...] = (
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S.%f%z',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+)
+
+# ISO 8601 strptime format that last parsed successfully (tried first next time)
+_last_iso_format: Optional[str] = None
 
 
 def compare_numbers(
@@ -34,17 +57,21 @@ def compare_numbers(
     Returns:
         Tuple of (is_match, message)
     """
-    try:
-        old_float = float(old)
-        new_float = float(new)
-    except (ValueError, TypeError) as e:
-        return False, f"Cannot convert to number: {e}"
+    if type(old) is float and type(new) is float:
+        old_float = old
+        new_float = new
+    else:
+        try:
+            old_float = float(old)
+            new_float = float(new)
+        except (ValueError, TypeError) as e:
+            return False, f"Cannot convert to number: {e}"
 
     if precision is not None:
-        diff = abs(old_float - new_float)
-        if diff <= precision:
+        diff = old_float - new_float
+        if -precision <= diff <= precision:
             return True, ""
-        return False, f"Value difference ({diff}) exceeds precision tolerance ({precision})"
+        return False, f"Value difference ({abs(diff)}) exceeds precision tolerance ({precision})"
 
     if old_float == new_float:
         return True, ""
@@ -52,7 +79,81 @@ def compare_numbers(
     return False, f"Values differ: {old} != {new}"
 
 
+def find_number_mismatches(
+    old: list,
+    new: list,
+    precision: Optional[float] = None
+) -> list[int]:
+    """
+    Compare two equal-length lists of numbers in a single pass.
+
+    Applies the same test as ``compare_numbers`` to each position, without
+    building a message per element.
+
+    Args:
+        old: The old numbers
+        new: The new numbers
+        precision: Maximum allowed difference
+
+    Returns:
+        Indices whose values do not match
+    """
+    # Packing into C double arrays compares the whole run in C (NaN never
+    # equals itself there, unlike in list equality); only locate the
+    # differing positions when they are not all equal. With a precision
+    # the values are subtracted, and inf - inf is NaN, so equal runs only
+    # settle here when their (C-level) sum shows they are all finite
+    try:
+        old_doubles = array('d', old)
+        if old_doubles == array('d', new) and (
+            precision is None or isfinite(sum(old_doubles))
+        ):
+            return []
+    except OverflowError:
+        pass
+
+    if precision is None:
+        return [
+            i for i, (o, n) in enumerate(zip(old, new))
+            if float(o) != float(n)
+        ]
+
+    # Same test as compare_numbers, so a NaN difference is a mismatch.
+    # Chaining map()/compress() to stay in C measured no faster than this
+    # loop, since every float is boxed
+    return [
+        i for i, (o, n) in enumerate(zip(old, new))
+        if not -precision <= float(o) - float(n) <= precision
+    ]
+
+
 def compare_strings(
+    old: Any,
+    new: Any,
+    rules: FieldRules
+) -> tuple[bool, str]:
+    """
+    Compare two values as strings with various rules.
+
+    Non-string values are converted with ``str()`` (``None`` becomes an
+    empty string) before delegating to ``compare_strings_fast``.
+
+    Args:
+        old: The old value
+        new: The new value
+        rules: Field rules containing comparison options
+
+    Returns:
+        Tuple of (is_match, message)
+    """
+    if type(old) is not str:
+        old = str(old) if old is not None else ""
+    if type(new) is not str:
+        new = str(new) if new is not None else ""
+    return compare_strings_fast(old, new, rules)
+
+
+def compare_strings_fast(
     old: str,
     new: str,
     rules: FieldRules
@@ -68,24 +169,22 @@ def compare_strings(
     Returns:
         Tuple of (is_match, message)
     """
-    old_str = str(old) if old is not None else ""
-    new_str = str(new) if new is not None else ""
-
-    # Apply transformations
-    if rules.trim_whitespace:
-        old_str = old_str.strip()
-        new_str = new_str.strip()
-
-    if rules.case_insensitive:
-        old_str = old_str.lower()
-        new_str = new_str.lower()
+    # Apply transformations (trim / lowercase, resolved once per rules object)
+    transform = rules._string_transform
+    old_str = transform(old)
+    new_str = transform(new)
 
     # Pattern matching
     if rules.pattern:
         try:
-            pattern = _compile_pattern(rules.pattern)
-            old_matches = bool(pattern.match(old_str))
-            new_matches = bool(pattern.match(new_str))
+            fullmatch = rules._pattern_fullmatch
+        except re.error:
+            # Invalid regex, fall back to exact comparison
+            fullmatch = None
+
+        if fullmatch is not None:
+            old_matches = fullmatch(old_str) is not None
+            new_matches = fullmatch(new_str) is not None
 
             if not old_matches and not new_matches:
                 return False, f"Neither value matches pattern '{rules.pattern}'"
@@ -94,9 +193,6 @@ def compare_strings(
             if not new_matches:
                 return False, f"New value '{new}' doesn't match pattern '{rules.pattern}'"
             return True, ""
-        except re.error as e:
-            # Invalid regex, fall back to exact comparison
-            pass
 
     # Exact comparison
     if old_str == new_str:
@@ -117,31 +213,34 @@ def parse_datetime(value: str, fmt: Optional[str] = None) -> datetime:
         Parsed datetime object
     """
     if fmt is None or fmt.upper() == 'ISO8601':
-        # Try ISO 8601 format
-        # Handle various ISO formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%f%z',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%S.%f',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d %H:%M:%S.%f',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-        ]
-        for f in formats:
-            try:
-                return datetime.strptime(value, f)
-            except ValueError:
-                continue
+        global _last_iso_format
 
-        # Try fromisoformat as fallback
+        # Fast path: fromisoformat handles the common ISO 8601 shapes in C.
+        # A trailing 'Z' is dropped so the result stays naive, matching the
+        # strptime formats below.
         try:
-            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            return datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
         except ValueError:
             pass
 
+        # Handle the remaining ISO formats, starting with the last one that worked
+        last_format = _last_iso_format
+        if last_format is not None:
+            try:
+                return datetime.strptime(value, last_format)
+            except ValueError:
+                pass
+
+        for f in _ISO_FORMATS:
+            if f == last_format:
+                continue
+            try:
+                result = datetime.strptime(value, f)
+            except ValueError:
+                continue
+            _last_iso_format = f
+            return result
+
         raise ValueError(f"Cannot parse datetime '{value}' as ISO8601")
     else:
         return datetime.strptime(value, fmt)
@@ -151,7 +250,8 @@ def compare_datetime(
     old: str,
     new: str,
     fmt: Optional[str] = None,
-    tolerance: Optional[str] = None
+    tolerance: Optional[str] = None,
+    tolerance_seconds: Optional[float] = None
 ) -> tuple[bool, str]:
     """
     Compare two datetime values with optional tolerance.
@@ -161,6 +261,7 @@ def compare_datetime(
         new: The new datetime string
         fmt: Datetime format string
         tolerance: Tolerance duration string (e.g., '5s', '1m')
+        tolerance_seconds: Pre-parsed tolerance (skips parsing ``tolerance``)
 
     Returns:
         Tuple of (is_match, message)
@@ -172,14 +273,16 @@ def compare_datetime(
         return False, f"Cannot parse datetime: {e}"
 
     if tolerance:
-        try:
-            tolerance_td = parse_duration(tolerance)
-            diff = abs((old_dt - new_dt).total_seconds())
-            if diff <= tolerance_td.total_seconds():
-                return True, ""
-            return False, f"Time difference ({diff}s) exceeds tolerance ({tolerance})"
-        except ValueError as e:
-            return False, f"Invalid tolerance format: {e}"
+        if tolerance_seconds is None:
+            try:
+                tolerance_seconds = parse_duration(tolerance).total_seconds()
+            except ValueError as e:
+                return False, f"Invalid tolerance format: {e}"
+
+        diff = abs((old_dt - new_dt).total_seconds())
+        if diff <= tolerance_seconds:
+            return True, ""
+        return False, f"Time difference ({diff}s) exceeds tolerance ({tolerance})"
 
     if old_dt == new_dt:
         return True, ""
@@ -203,11 +306,16 @@ def compare_with_rules(
     Returns:
         Tuple of (is_match, message)
     """
+    # Equal same-type values match without further dispatch (no identity
+    # check: NaN, which json.loads hands out as one object, never matches)
+    if _allows_equality_shortcut(rules) and type(old) is type(new) and old == new:
+        return True, ""
+
     # Apply type casting if specified
-    if rules.cast:
-        from .utils import safe_cast
-        old = safe_cast(old, rules.cast.value)
-        new = safe_cast(new, rules.cast.value)
+    cast = rules._cast_fn
+    if cast is not None:
+        old = cast(old)
+        new = cast(new)
 
     # Handle None/null values
     if old is None and new is None:
@@ -231,13 +339,18 @@ def compare_with_rules(
             str(old),
             str(new),
             rules.datetime_format,
-            rules.datetime_tolerance
+            rules.datetime_tolerance,
+            rules.datetime_tolerance_seconds
         )
 
     # Numeric comparison
     if rules.precision is not None:
         return compare_numbers(old, new, rules.precision)
 
+    # String comparison without coercion
+    if type(old) is str and type(new) is str:
+        return compare_strings_fast(old, new, rules)
+
     # Check if both are numeric (even without precision rule)
     if isinstance(old, (int, float)) and isinstance(new, (int, float)):
         return compare_numbers(old, new, None)
@@ -257,3 +370,158 @@ def compare_with_rules(
         return True, ""
 
     return False, f"Values differ: {old} != {new}"
+
+
+def _comparator_key(rules: FieldRules) -> Optional[tuple]:
+    """Build a hashable cache key from the rules used by scalar comparison."""
+    key = (
+        rules.strategy,
+        rules.cast,
+        rules.has_default,
+        # Typed, so 1 / True / 1.0 defaults don't share a comparator
+        _freeze(rules.default),
+        rules.datetime_format,
+        rules.datetime_tolerance,
+        rules.datetime_tolerance_seconds,
+        rules.precision,
+        rules.trim_whitespace,
+        rules.case_insensitive,
+        rules.pattern,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable rule value (e.g. a set inside the default) - compile
+        # without caching
+        return None
+    return key
+
+
+def compile_rules(rules: FieldRules) -> Comparator:
+    """
+    Compile field rules into a specialized comparator.
+
+    The returned callable behaves like ``compare_with_rules(old, new, rules)``
+    but only performs the casting, null handling and type dispatch that the
+    rule set actually requires. The lenient strategy implies whitespace
+    trimming and case-insensitive string comparison.
+
+    Args:
+        rules: Field rules for comparison
+
+    Returns:
+        Callable taking (old, new) and returning (is_match, message)
+    """
+    key = _comparator_key(rules)
+    if key is None:
+        return _build_comparator(rules)
+
+    cache = _compiled_comparators
+    comparator = cache.get(key)
+    if comparator is None:
+        comparator = cache[key] = _build_comparator(rules)
+        if len(cache) > _COMPILED_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return comparator
+
+
+def _allows_equality_shortcut(rules: FieldRules) -> bool:
+    """
+    Check whether equal values can be reported as matching immediately.
+
+    Pattern, datetime and precision rules still have to validate (or parse)
+    equal values, so they opt out.
+    """
+    return rules.pattern is None and not rules.datetime_format and rules.precision is None
+
+
+def _build_comparator(rules: FieldRules) -> Comparator:
+    """Build the comparator closure for a rule set."""
+    if rules.strategy == MigrationStrategy.LENIENT:
+        rules = replace(rules, trim_whitespace=True, case_insensitive=True)
+
+    comparator = _build_null_aware_comparator(rules)
+    if not _allows_equality_shortcut(rules):
+        return comparator
+
+    compare_unequal = comparator
+
+    def comparator(old: Any, new: Any) -> tuple[bool, str]:
+        if type(old) is type(new) and old == new:
+            return True, ""
+        return compare_unequal(old, new)
+    return comparator
+
+
+def _build_null_aware_comparator(rules: FieldRules) -> Comparator:
+    """Build the comparator handling casting, nulls and defaults."""
+    compare_values = _build_value_comparator(rules)
+
+    cast = rules._cast_fn
+    has_default = rules.has_default
+    default = rules.default
+
+    if cast is None and not has_default:
+        def comparator(old: Any, new: Any) -> tuple[bool, str]:
+            if old is None:
+                if new is None:
+                    return True, ""
+                return False, f"Old value is null, new value is '{new}'"
+            if new is None:
+                return False, f"Old value is '{old}', new value is null"
+            return compare_values(old, new)
+        return comparator
+
+    def comparator(old: Any, new: Any) -> tuple[bool, str]:
+        if cast is not None:
+            old = cast(old)
+            new = cast(new)
+
+        if old is None and new is None:
+            return True, ""
+
+        if old is None:
+            if not has_default:
+                return False, f"Old value is null, new value is '{new}'"
+            old = default
+
+        if new is None:
+            if not has_default:
+                return False, f"Old value is '{old}', new value is null"
+            new = default
+
+        return compare_values(old, new)
+    return comparator
+
+
+def _build_value_comparator(rules: FieldRules) -> Comparator:
+    """Build the comparator for two non-null values."""
+    if rules.datetime_format:
+        fmt = rules.datetime_format
+        tolerance = rules.datetime_tolerance
+        tolerance_seconds = rules.datetime_tolerance_seconds
+
+        def compare_values(old: Any, new: Any) -> tuple[bool, str]:
+            return compare_datetime(str(old), str(new), fmt, tolerance, tolerance_seconds)
+        return compare_values
+
+    if rules.precision is not None:
+        precision = rules.precision
+
+        def compare_values(old: Any, new: Any) -> tuple[bool, str]:
+            return compare_numbers(old, new, precision)
+        return compare_values
+
+    def compare_values(old: Any, new: Any) -> tuple[bool, str]:
+        if type(old) is str and type(new) is str:
+            return compare_strings_fast(old, new, rules)
+        if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+            return compare_numbers(old, new, None)
+        if isinstance(old, str) or isinstance(new, str):
+            return compare_strings(old, new, rules)
+        if old == new:
+            return True, ""
+        return False, f"Values differ: {old} != {new}"
+    return compare_values
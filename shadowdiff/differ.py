@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import json
+import operator
+import sys
+from typing import Any, Generator, Optional
 
 from .models import (
     FieldRules,
@@ -16,17 +19,80 @@ from .models import (
 )
 from .schema import SchemaTraverser
 from .normalizer import KeyedArrayTransformer
-from .comparators import compare_with_rules
+from .comparators import (
+    find_number_mismatches,
+    _allows_equality_shortcut,
+)
 from .jsonpath_utils import evaluate_condition
 from .utils import (
     get_type_name,
     values_equal,
-    extract_key_value,
-    format_key_value,
     build_path,
+    _key_segment,
 )
 
 
+_NUMBER_TYPES = frozenset((int, float))
+_MISSING = object()
+_PLAIN_SCALAR_TYPES = frozenset((str, int, float, bool))
+
+# Generator comparing an object/array: yields (old, new, path, parent_rules)
+# per child, is sent the child's match result, and returns the node's result
+_NodeVisit = Generator[tuple, Optional[bool], bool]
+
+
+def _canonical_json(value: Any) -> str:
+    """Serialize a JSON value with sorted keys (raises ValueError on NaN)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def _count_leaves(value: Any) -> int:
+    """Count the non-container values in a JSON value."""
+    count = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+        else:
+            count += 1
+    return count
+
+
+class _Abort(Exception):
+    """Unwinds a fail-fast or dry-run comparison at its first diff."""
+
+
+def _equality_hash(value: Any) -> Optional[int]:
+    """
+    Hash a value so that values equal without rules hash equally.
+
+    Python equality is looser than the diff's (true equals 1), so this holds
+    for objects in any key order and numbers of either type (1 and 1.0) too.
+
+    Args:
+        value: A JSON value
+
+    Returns:
+        The hash, or None if the value cannot be hashed
+    """
+    try:
+        return hash(_frozen(value))
+    except (TypeError, RecursionError):
+        return None
+
+
+def _frozen(value: Any) -> Any:
+    """Convert a JSON value into a hashable one that compares the same way."""
+    if isinstance(value, dict):
+        return frozenset((key, _frozen(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(map(_frozen, value))
+    return value
+
+
 class Differ:
     """
     Performs typed deep comparison of normalized payloads.
@@ -56,6 +122,22 @@ class Differ:
         self.fields_checked = 0
         self._aborted = False
 
+        # Rules per (path, id(parent_rules)); entries keep parent_rules so a
+        # reused id can be detected
+        self._rules_cache: dict[tuple[str, int], tuple[Optional[FieldRules], FieldRules]] = {}
+
+        # Unordered-array item comparisons per (id(old), id(new), id(rules));
+        # entries keep the three objects, since temporary items (e.g. merged
+        # duplicates) can be freed mid-diff and their ids reused
+        self._items_equal_cache: dict[tuple[int, int, int], tuple[Any, Any, FieldRules, bool]] = {}
+
+        # Nesting depth of dry-run comparisons, which record nothing and stop
+        # at the first diff (see _items_equal)
+        self._suppress_emit = 0
+
+        # x-migration-when results; root_data does not change during a diff
+        self._condition_cache: dict[str, bool] = {}
+
     def diff(
         self,
         old: Any,
@@ -75,14 +157,78 @@ class Differ:
         Returns:
             True if values match, False otherwise
         """
+        try:
+            return self._walk(old, new, path, parent_rules)
+        except _Abort:
+            # fail_fast (or a dry run) stopped at the first diff
+            return False
+
+    def _walk(
+        self,
+        old: Any,
+        new: Any,
+        path: str,
+        parent_rules: Optional[FieldRules]
+    ) -> bool:
+        """Run ``diff`` from an explicit stack of node generators."""
+        # Objects and arrays are handled by generators that yield a
+        # (old, new, path, parent_rules) request per child and receive the
+        # child's result back. Driving them from an explicit stack keeps
+        # nesting depth off the Python call stack while preserving the
+        # order in which diffs are reported.
+        visit = self._visit
+        result = visit(old, new, path, parent_rules)
+        if type(result) is bool:
+            return result
+
+        stack: list[_NodeVisit] = [result]
+        push = stack.append
+        pop = stack.pop
+        current_send = result.send
+        child_result: Optional[bool] = None
+
+        while True:
+            try:
+                child = current_send(child_result)
+            except StopIteration as done:
+                pop()
+                child_result = done.value
+                if not stack:
+                    break
+                current_send = stack[-1].send
+                continue
+
+            result = visit(*child)
+            if type(result) is bool:
+                child_result = result
+            else:
+                push(result)
+                current_send = result.send
+                child_result = None
+
+        return child_result
+
+    def _visit(
+        self,
+        old: Any,
+        new: Any,
+        path: str,
+        parent_rules: Optional[FieldRules]
+    ) -> bool | _NodeVisit:
+        """
+        Compare a single node.
+
+        Returns the result for leaves and rule-resolved nodes, or a generator
+        for objects and arrays (see ``diff``).
+        """
         if self._aborted:
             return False
 
-        rules = self.traverser.get_rules_for_path(path, parent_rules)
+        rules = self._get_rules(path, parent_rules)
 
         # Check conditional rule
         if rules.when_condition:
-            if not evaluate_condition(self.root_data, rules.when_condition):
+            if not self._eval_condition(rules.when_condition):
                 self._add_trace(path, 'x-migration-when', 'skipped',
                                {'condition': rules.when_condition})
                 return True
@@ -111,6 +257,15 @@ class Differ:
             self.fields_checked += 1
             return True
 
+        # Fast path: identical plain scalars match under every rule that
+        # allows an equality shortcut, so skip the comparator dispatch
+        old_type = type(old)
+        if (old_type in _PLAIN_SCALAR_TYPES and old_type is type(new) and
+                old == new and rules.cast is None and
+                _allows_equality_shortcut(rules)):
+            self.fields_checked += 1
+            return True
+
         # Handle null values
         if old is None and new is None:
             self.fields_checked += 1
@@ -137,10 +292,10 @@ class Differ:
             return False
 
         # Apply type casting before type check
-        if rules.cast:
-            from .utils import safe_cast
-            old = safe_cast(old, rules.cast.value)
-            new = safe_cast(new, rules.cast.value)
+        cast = rules._cast_fn
+        if cast is not None:
+            old = cast(old)
+            new = cast(new)
             self._add_trace(path, 'x-migration-cast', 'applied',
                            {'cast_type': rules.cast.value})
 
@@ -171,70 +326,135 @@ class Differ:
         else:
             return self._diff_scalars(old, new, path, rules)
 
+    def _eval_condition(self, condition: str) -> bool:
+        """Evaluate an x-migration-when condition against the root data, once."""
+        result = self._condition_cache.get(condition)
+        if result is None:
+            result = evaluate_condition(self.root_data, condition)
+            self._condition_cache[condition] = result
+        return result
+
+    def _get_rules(
+        self,
+        path: str,
+        parent_rules: Optional[FieldRules]
+    ) -> FieldRules:
+        """Get the rules for a path, memoized for the lifetime of this differ."""
+        key = (path, id(parent_rules))
+        entry = self._rules_cache.get(key)
+        if entry is not None and entry[0] is parent_rules:
+            return entry[1]
+
+        rules = self.traverser.get_rules_for_path(path, parent_rules)
+        self._rules_cache[key] = (parent_rules, rules)
+        return rules
+
     def _diff_objects(
         self,
         old: dict,
         new: dict,
         path: str,
         rules: FieldRules
-    ) -> bool:
+    ) -> _NodeVisit:
         """Compare two objects."""
+        if self._plain_subtree_equal(old, new, path):
+            return True
+
         all_match = True
-        all_keys = set(old.keys()) | set(new.keys())
+        ignore = MigrationStrategy.IGNORE
+        missing = _MISSING
+        new_get = new.get
+        key_segment = _key_segment
+
+        # Rules for extra/missing keys, resolved once per object on demand
+        child_rules_map = None
+        shared_keys = 0
+
+        # Keys of old, in order: shared keys recurse, absent ones are missing
+        for key, old_value in old.items():
+            # Object keys are nearly always strings: skip build_path's dispatch
+            child_path = path + key_segment(key) if type(key) is str else build_path(path, key)
+            new_value = new_get(key, missing)
+
+            if new_value is not missing:
+                shared_keys += 1
+                if not (yield (old_value, new_value, child_path, rules)):
+                    all_match = False
+                continue
 
-        for key in all_keys:
-            if self._aborted:
-                return False
+            # Missing field in new
+            if child_rules_map is None:
+                child_rules_map = self.traverser.get_child_rules(path, rules)
+            declared, undeclared = child_rules_map
+            child_rules = declared.get(key, undeclared)
 
-            child_path = build_path(path, key)
+            if child_rules.strategy is ignore:
+                continue
 
-            if key not in old:
-                # Extra field in new
-                child_rules = self.traverser.get_rules_for_path(child_path, rules)
-                if child_rules.strategy != MigrationStrategy.IGNORE:
-                    self._add_diff(
-                        path=child_path,
-                        diff_type=DiffType.EXTRA_IN_NEW,
-                        old_value=None,
-                        new_value=new[key],
-                        message=f"Extra field in new: {key}"
-                    )
+            if child_rules.has_default:
+                # Compare old value with default
+                if not (yield (old_value, child_rules.default, child_path, rules)):
                     all_match = False
-                continue
+            else:
+                self._add_diff(
+                    path=child_path,
+                    diff_type=DiffType.MISSING_IN_NEW,
+                    old_value=old_value,
+                    new_value=None,
+                    message=f"Field missing in new: {key}"
+                )
+                all_match = False
 
-            if key not in new:
-                # Missing field in new
-                child_rules = self.traverser.get_rules_for_path(child_path, rules)
-                if child_rules.strategy != MigrationStrategy.IGNORE:
-                    # Check for default
-                    if child_rules.has_default:
-                        # Compare old value with default
-                        if not self.diff(old[key], child_rules.default, child_path, rules):
-                            all_match = False
-                    else:
-                        self._add_diff(
-                            path=child_path,
-                            diff_type=DiffType.MISSING_IN_NEW,
-                            old_value=old[key],
-                            new_value=None,
-                            message=f"Field missing in new: {key}"
-                        )
-                        all_match = False
-                continue
+        # Keys only in new are extra fields
+        if len(new) > shared_keys:
+            for key, new_value in new.items():
+                if key in old:
+                    continue
+                if child_rules_map is None:
+                    child_rules_map = self.traverser.get_child_rules(path, rules)
+                declared, undeclared = child_rules_map
+                if declared.get(key, undeclared).strategy is ignore:
+                    continue
 
-            # Both have the key - recurse
-            if not self.diff(old[key], new[key], child_path, rules):
+                self._add_diff(
+                    path=build_path(path, key),
+                    diff_type=DiffType.EXTRA_IN_NEW,
+                    old_value=None,
+                    new_value=new_value,
+                    message=f"Extra field in new: {key}"
+                )
                 all_match = False
 
         return all_match
 
+    def _plain_subtree_equal(self, old: dict, new: dict, path: str) -> bool:
+        """
+        Check for equal objects whose schema declares no rules below them.
+
+        Such a subtree would be compared by plain equality anyway, so a match
+        is settled without visiting it (counting its leaves as checked). The
+        canonical JSON comparison keeps the diff's type strictness: true is
+        not 1, and NaN never matches.
+        """
+        if old != new or self.traverser.has_rules_under(path):
+            return False
+
+        try:
+            if _canonical_json(old) != _canonical_json(new):
+                return False
+        except (TypeError, ValueError):
+            return False
+
+        self.fields_checked += _count_leaves(old)
+        return True
+
     def _diff_arrays(
         self,
         old: list,
         new: list,
         path: str,
         rules: FieldRules
-    ) -> bool:
+    ) -> bool | _NodeVisit:
         """Compare two arrays based on array mode."""
         if rules.array_mode == ArrayMode.KEYED:
             return self._diff_keyed_arrays(old, new, path, rules)
@@ -249,7 +469,7 @@ class Differ:
         new: list,
         path: str,
         rules: FieldRules
-    ) -> bool:
+    ) -> _NodeVisit:
         """Compare arrays index-by-index (order matters)."""
         all_match = True
 
@@ -277,12 +497,17 @@ class Differ:
 
         # Compare common elements
         min_len = min(len(old), len(new))
-        for i in range(min_len):
-            if self._aborted:
-                return False
+        indices = range(min_len)
 
+        batch_mismatches = self._batch_scalar_mismatches(old, new, min_len, path, rules)
+        if batch_mismatches is not None:
+            # Only mismatched positions need the full per-element diff
+            self.fields_checked += min_len - len(batch_mismatches)
+            indices = batch_mismatches
+
+        for i in indices:
             child_path = f"{path}[{i}]"
-            if not self.diff(old[i], new[i], child_path, rules):
+            if not (yield (old[i], new[i], child_path, rules)):
                 all_match = False
 
         # Handle extra items in new
@@ -319,6 +544,55 @@ class Differ:
 
         return all_match
 
+    def _batch_scalar_mismatches(
+        self,
+        old: list,
+        new: list,
+        length: int,
+        path: str,
+        rules: FieldRules
+    ) -> Optional[list[int]]:
+        """
+        Compare the common prefix of two scalar arrays in one pass.
+
+        Numbers are compared in bulk (with the items' precision); arrays of a
+        single other scalar type are compared for equality, leaving unequal
+        positions to the per-element diff. Returns the indices that need that
+        diff, or None when the items are not plain scalars or their rules
+        need every element diffed.
+        """
+        if (self.trace_rules and not self._suppress_emit) or length == 0:
+            return None
+
+        old_items = old[:length]
+        new_items = new[:length]
+        old_types = set(map(type, old_items))
+        new_types = set(map(type, new_items))
+
+        numeric = old_types <= _NUMBER_TYPES and new_types <= _NUMBER_TYPES
+        if not numeric and not (
+            len(old_types) == 1 and old_types == new_types and
+            old_types <= _PLAIN_SCALAR_TYPES
+        ):
+            return None
+
+        item_rules = self.traverser.get_rules_for_array_item(path, rules)
+        if (item_rules.when_condition or item_rules.cast or item_rules.datetime_format or
+                item_rules.strategy in (MigrationStrategy.IGNORE, MigrationStrategy.EXISTS)):
+            return None
+
+        if numeric:
+            return find_number_mismatches(old_items, new_items, item_rules.precision)
+
+        if not _allows_equality_shortcut(item_rules):
+            return None
+        if old_items == new_items:
+            return []
+        return [
+            i for i, equal in enumerate(map(operator.eq, old_items, new_items))
+            if not equal
+        ]
+
     def _diff_unordered_arrays(
         self,
         old: list,
@@ -334,18 +608,49 @@ class Differ:
         old_matched = [False] * len(old)
         new_matched = [False] * len(new)
 
-        # Try to match each old item with a new item
-        for i, old_item in enumerate(old):
-            for j, new_item in enumerate(new):
-                if new_matched[j]:
+        # Without rules on or below the items, only items that hash equally
+        # (see _equality_hash) can be equal. Each old item then only scans
+        # its bucket of new items, in index order, which pairs items exactly
+        # as the pairwise scan below does. Rules such as precision make
+        # unequal values match, so those arrays keep the pairwise scan
+        hashes = None
+        if not rules.inherit_rules and not self.traverser.has_rules_under(path):
+            hashes = list(map(_equality_hash, old + new))
+            if None in hashes:
+                hashes = None
+
+        if hashes is not None:
+            new_by_hash: dict[int, list[int]] = {}
+            for j, item_hash in enumerate(hashes[len(old):]):
+                new_by_hash.setdefault(item_hash, []).append(j)
+
+            for i, old_item in enumerate(old):
+                bucket = new_by_hash.get(hashes[i])
+                if not bucket:
                     continue
 
-                if self._items_equal(old_item, new_item, f"{path}[{i}]", rules):
-                    old_matched[i] = True
-                    new_matched[j] = True
-                    self.fields_checked += 1
+                for pos, j in enumerate(bucket):
+                    if self._items_equal(old_item, new[j], f"{path}[{i}]", rules):
+                        old_matched[i] = True
+                        new_matched[j] = True
+                        self.fields_checked += 1
+                        del bucket[pos]
+                        break
+        else:
+            # Try to match each old item with the first unmatched new item
+            unmatched_new = list(range(len(new)))
+            for i, old_item in enumerate(old):
+                if not unmatched_new:
                     break
 
+                for pos, j in enumerate(unmatched_new):
+                    if self._items_equal(old_item, new[j], f"{path}[{i}]", rules):
+                        old_matched[i] = True
+                        new_matched[j] = True
+                        self.fields_checked += 1
+                        del unmatched_new[pos]
+                        break
+
         # Report unmatched old items
         for i, matched in enumerate(old_matched):
             if not matched:
@@ -386,78 +691,89 @@ class Differ:
         new: list,
         path: str,
         rules: FieldRules
-    ) -> bool:
+    ) -> _NodeVisit:
         """Compare arrays by matching objects using a key field."""
         all_match = True
 
         transformer = KeyedArrayTransformer(self.traverser)
         old_map, new_map, duplicates = transformer.transform(old, new, rules)
 
-        # Report duplicate key errors
+        # Report duplicate key errors (single-field keys display as the bare
+        # value, composite keys as the tuple)
         for dup in duplicates:
+            dup_key = dup['key']
+            key_display = repr(dup_key[0]) if len(dup_key) == 1 else repr(dup_key)
             self._add_diff(
                 path=path,
                 diff_type=DiffType.DUPLICATE_KEY,
                 old_value=None,
                 new_value=None,
-                message=f"Duplicate key {format_key_value(dup['key'])} at indices {dup['indices']}",
+                message=f"Duplicate key {key_display} at indices {dup['indices']}",
                 rule=f"x-migration-array-key: {rules.array_key}"
             )
             all_match = False
 
-        # Compare matched items
-        all_keys = set(old_map.keys()) | set(new_map.keys())
         key_spec = rules.array_key or "id"
+        missing = _MISSING
+        new_get = new_map.get
 
-        for key in all_keys:
-            if self._aborted:
-                return False
+        # JSONPath-like prefix/suffix for keyed items, built once per array
+        if isinstance(key_spec, str):
+            item_prefix, item_suffix = f"{path}[?(@.{key_spec}==", ")]"
+        else:
+            item_prefix, item_suffix = f"{path}[key=", "]"
 
-            key_display = format_key_value(key)
-            # Build a JSONPath-like path for keyed items
-            if isinstance(key_spec, str):
-                item_path = f"{path}[?(@.{key_spec}=={key_display})]"
-            else:
-                item_path = f"{path}[key={key_display}]"
+        # Keys of old, in order: matched items are compared, the rest are missing
+        for key, old_item in old_map.items():
+            key_display = repr(key[0]) if len(key) == 1 else repr(key)
+            item_path = item_prefix + key_display + item_suffix
 
-            if key not in old_map:
-                if rules.ignore_extra_items:
-                    self._add_warning(
-                        path=item_path,
-                        diff_type=DiffType.ARRAY_ITEM_EXTRA,
-                        message=f"Extra item with key {key_display} in new (allowed)"
-                    )
-                else:
-                    self._add_diff(
-                        path=item_path,
-                        diff_type=DiffType.ARRAY_ITEM_EXTRA,
-                        old_value=None,
-                        new_value=new_map[key],
-                        message=f"Extra item with key {key_display} in new array"
-                    )
+            new_item = new_get(key, missing)
+            if new_item is not missing:
+                # Both have the key - compare the objects
+                if not (yield (old_item, new_item, item_path, rules)):
                     all_match = False
                 continue
 
-            if key not in new_map:
-                if rules.ignore_missing_items:
-                    self._add_warning(
-                        path=item_path,
-                        diff_type=DiffType.ARRAY_ITEM_MISSING,
-                        message=f"Missing item with key {key_display} in new (allowed)"
-                    )
-                else:
-                    self._add_diff(
-                        path=item_path,
-                        diff_type=DiffType.ARRAY_ITEM_MISSING,
-                        old_value=old_map[key],
-                        new_value=None,
-                        message=f"Missing item with key {key_display} in new array"
-                    )
-                    all_match = False
+            if rules.ignore_missing_items:
+                self._add_warning(
+                    path=item_path,
+                    diff_type=DiffType.ARRAY_ITEM_MISSING,
+                    message=f"Missing item with key {key_display} in new (allowed)"
+                )
+            else:
+                self._add_diff(
+                    path=item_path,
+                    diff_type=DiffType.ARRAY_ITEM_MISSING,
+                    old_value=old_item,
+                    new_value=None,
+                    message=f"Missing item with key {key_display} in new array"
+                )
+                all_match = False
+
+        # Keys only in new are extra items
+        old_has_key = old_map.__contains__
+        for key, new_item in new_map.items():
+            if old_has_key(key):
                 continue
 
-            # Both have the key - compare the objects
-            if not self.diff(old_map[key], new_map[key], item_path, rules):
+            key_display = repr(key[0]) if len(key) == 1 else repr(key)
+            item_path = item_prefix + key_display + item_suffix
+
+            if rules.ignore_extra_items:
+                self._add_warning(
+                    path=item_path,
+                    diff_type=DiffType.ARRAY_ITEM_EXTRA,
+                    message=f"Extra item with key {key_display} in new (allowed)"
+                )
+            else:
+                self._add_diff(
+                    path=item_path,
+                    diff_type=DiffType.ARRAY_ITEM_EXTRA,
+                    old_value=None,
+                    new_value=new_item,
+                    message=f"Extra item with key {key_display} in new array"
+                )
                 all_match = False
 
         return all_match
@@ -472,13 +788,8 @@ class Differ:
         """Compare scalar values."""
         self.fields_checked += 1
 
-        # Apply lenient comparison if specified
-        if rules.strategy == MigrationStrategy.LENIENT:
-            # For lenient mode, use trim_whitespace and case_insensitive
-            rules.trim_whitespace = True
-            rules.case_insensitive = True
-
-        is_match, message = compare_with_rules(old, new, rules)
+        # Lenient mode (trim + case-insensitive) is handled by the compiled comparator
+        is_match, message = rules._compare_fn(old, new)
 
         if is_match:
             if rules.precision is not None:
@@ -486,20 +797,8 @@ class Differ:
                                {'precision': rules.precision})
             return True
 
-        # Determine diff type based on rules
-        diff_type = DiffType.VALUE_MISMATCH
-
-        if rules.precision is not None:
-            diff_type = DiffType.PRECISION_EXCEEDED
-            rule_applied = f"x-migration-precision: {rules.precision}"
-        elif rules.pattern is not None:
-            diff_type = DiffType.PATTERN_MISMATCH
-            rule_applied = f"x-migration-pattern: {rules.pattern}"
-        elif rules.datetime_tolerance is not None:
-            diff_type = DiffType.DATETIME_EXCEEDED
-            rule_applied = f"x-migration-datetime-tolerance: {rules.datetime_tolerance}"
-        else:
-            rule_applied = None
+        # Diff type and rule text depend only on the rules
+        diff_type, rule_applied = rules._mismatch_info
 
         self._add_diff(
             path=path,
@@ -520,14 +819,38 @@ class Differ:
         rules: FieldRules
     ) -> bool:
         """Check if two items are equal (for unordered array comparison)."""
-        # Create a temporary differ to avoid polluting our diffs
-        temp_differ = Differ(
-            self.traverser,
-            self.root_data,
-            fail_fast=True,
-            trace_rules=False
-        )
-        return temp_differ.diff(old, new, path, rules)
+        # Cheap rejection before a deep compare: an object or array can only
+        # match a value of the same container type, unless a rule such as
+        # cast/exists/ignore/when changes how the item is compared
+        if type(old) is not type(new) and (
+            isinstance(old, (dict, list)) or isinstance(new, (dict, list))
+        ):
+            item_rules = self._get_rules(path, rules)
+            if not (item_rules.cast or item_rules.when_condition or
+                    item_rules.strategy != MigrationStrategy.STRICT):
+                return False
+
+        # Reuse the result if this object/array pair was already compared
+        cache_key = None
+        if isinstance(old, (dict, list)):
+            cache_key = (id(old), id(new), id(rules))
+            entry = self._items_equal_cache.get(cache_key)
+            if (entry is not None and entry[0] is old and entry[1] is new
+                    and entry[2] is rules):
+                return entry[3]
+
+        # Compare in dry-run mode so the attempt leaves no diffs behind
+        fields_checked, aborted = self.fields_checked, self._aborted
+        self._suppress_emit += 1
+        try:
+            result = self.diff(old, new, path, rules)
+        finally:
+            self._suppress_emit -= 1
+            self.fields_checked, self._aborted = fields_checked, aborted
+
+        if cache_key is not None:
+            self._items_equal_cache[cache_key] = (old, new, rules, result)
+        return result
 
     def _add_diff(
         self,
@@ -539,18 +862,22 @@ class Differ:
         rule: str = None
     ):
         """Add a diff entry."""
+        if self._suppress_emit:
+            # Dry run: the first diff settles the result
+            self._aborted = True
+            raise _Abort
+
+        # Positional in field order: (path, type, severity, old_value,
+        # new_value, message, rule_applied). Few distinct rule strings exist,
+        # so entries share one interned copy.
         self.diffs.append(DiffEntry(
-            path=path,
-            type=diff_type,
-            severity=Severity.ERROR,
-            old_value=old_value,
-            new_value=new_value,
-            message=message,
-            rule_applied=rule
+            path, diff_type, Severity.ERROR, old_value, new_value, message,
+            sys.intern(rule) if rule else rule
         ))
 
         if self.fail_fast:
             self._aborted = True
+            raise _Abort
 
     def _add_warning(
         self,
@@ -559,12 +886,12 @@ class Differ:
         message: str
     ):
         """Add a warning entry."""
-        self.warnings.append(WarningEntry(
-            path=path,
-            type=diff_type,
-            severity=Severity.WARNING,
-            message=message
-        ))
+        if self._suppress_emit:
+            return
+
+        self.warnings.append(
+            WarningEntry(path, diff_type, Severity.WARNING, message)
+        )
 
     def _add_trace(
         self,
@@ -574,10 +901,5 @@ class Differ:
         details: dict = None
     ):
         """Add a trace entry if tracing is enabled."""
-        if self.trace_rules:
-            self.traces.append(TraceEntry(
-                path=path,
-                rule=rule,
-                action=action,
-                details=details
-            ))
+        if self.trace_rules and not self._suppress_emit:
+            self.traces.append(TraceEntry(path, rule, action, details))
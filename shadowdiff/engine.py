@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import time
 import json
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
@@ -14,6 +16,7 @@ from .models import (
     Summary,
     Coverage,
     ErrorResponse,
+    _SLOTS,
 )
 from .schema import SchemaResolver, SchemaTraverser, RuleExtractor
 from .normalizer import Normalizer
@@ -28,6 +31,27 @@ from .exceptions import (
 )
 from .utils import get_json_size_mb
 
+# Most schema fragments whose resolution an engine keeps (least recently
+# used ones are dropped first)
+_SCHEMA_CACHE_SIZE = 16
+
+
+@dataclass(**_SLOTS)
+class _ResolvedSchema:
+    """Work cached per schema fragment by ShadowDiffEngine."""
+    fragment: dict
+    # repr() of the fragment when it was resolved; a mismatch means the
+    # fragment was mutated since
+    fingerprint: str
+    schema: dict
+    # Traverser whose schema node keyed caches (rules, child rules, rules
+    # below a node) each compare() call shares through fork()
+    traverser: SchemaTraverser
+    # Only keeps per schema node state (aliases, defaults, rules below a
+    # node), so it is reused across compare() calls
+    normalizer: Normalizer
+    field_count: Optional[int] = None
+
 
 class ShadowDiffEngine:
     """
@@ -37,6 +61,9 @@ class ShadowDiffEngine:
     2. Normalization: Apply transformations (aliases, defaults, enum maps, sorting)
     3. Masking: Filter out ignored fields
     4. Typed Diffing: Deep comparison with type-aware rules
+
+    The resolution of the last few schema fragments is cached per fragment
+    object, and is redone when the fragment's contents have changed since.
     """
 
     VERSION = "2.0.0"
@@ -49,6 +76,14 @@ class ShadowDiffEngine:
             config: Engine configuration (uses defaults if not provided)
         """
         self.config = config or EngineConfig()
+        # Resolution per schema fragment id, reused across compare() calls;
+        # an LRU of at most _SCHEMA_CACHE_SIZE entries, keeping the fragment
+        # so a reused id is detected
+        self._resolved_schemas: OrderedDict[int, _ResolvedSchema] = OrderedDict()
+
+    def clear_schema_cache(self) -> None:
+        """Forget cached schema resolutions."""
+        self._resolved_schemas.clear()
 
     def compare(
         self,
@@ -73,17 +108,18 @@ class ShadowDiffEngine:
             # Validate inputs
             self._validate_inputs(old_json, new_json, schema_fragment)
 
-            # Stage 1: Schema Resolution
-            resolver = SchemaResolver(schema_fragment, self.config.max_depth)
-            resolved_schema = resolver.resolve()
+            # Stage 1: Schema Resolution (and global rules extraction)
+            resolved = self._resolve_schema(schema_fragment)
 
-            # Create traverser and extract global rules
-            traverser = SchemaTraverser(resolved_schema)
-            global_rules = RuleExtractor.extract_global_rules(resolved_schema)
+            # Fork the cached traverser: its per schema node rules stay warm,
+            # while caches keyed by payload paths (array indices, keyed-array
+            # item values) live for this call only
+            traverser = resolved.traverser.fork()
 
             # Stage 2: Normalization
-            normalizer = Normalizer(resolved_schema, global_rules, traverser)
-            old_normalized, new_normalized = normalizer.normalize(old_json, new_json)
+            old_normalized, new_normalized = resolved.normalizer.normalize(
+                old_json, new_json
+            )
 
             # Stage 3: Masking
             masker = Masker(traverser)
@@ -125,7 +161,7 @@ class ShadowDiffEngine:
             # Add coverage if enabled
             if self.config.collect_statistics:
                 report.coverage = self._calculate_coverage(
-                    old_json, new_json, resolved_schema, differ
+                    old_json, new_json, resolved, differ
                 )
 
             return report
@@ -188,32 +224,78 @@ class ShadowDiffEngine:
                 {"type": type(schema_fragment).__name__}
             )
 
-        # Check payload sizes
+        # Check payload sizes (an oversized old payload skips measuring new)
         old_size = get_json_size_mb(old_json)
-        new_size = get_json_size_mb(new_json)
-
         if old_size > self.config.max_payload_size_mb:
             raise PayloadSizeError(old_size, self.config.max_payload_size_mb)
+
+        new_size = get_json_size_mb(new_json)
         if new_size > self.config.max_payload_size_mb:
             raise PayloadSizeError(new_size, self.config.max_payload_size_mb)
 
+    def _resolve_schema(self, schema_fragment: dict) -> _ResolvedSchema:
+        """
+        Resolve a schema fragment and extract its global rules.
+
+        Resolution walks the whole schema, so the result is kept per
+        fragment. The fragment is kept too so a reused id is detected, and
+        its repr() so an in-place mutation is: both are far cheaper than
+        resolving again.
+
+        Args:
+            schema_fragment: OpenAPI schema with x-migration-* extensions
+
+        Returns:
+            The fragment's cached (or new) resolution
+        """
+        cache = self._resolved_schemas
+        key = id(schema_fragment)
+        fingerprint = repr(schema_fragment)
+        entry = cache.get(key)
+        if (
+            entry is not None
+            and entry.fragment is schema_fragment
+            and entry.fingerprint == fingerprint
+        ):
+            cache.move_to_end(key)
+            return entry
+
+        resolver = SchemaResolver(schema_fragment, self.config.max_depth)
+        resolved_schema = resolver.resolve()
+        global_rules = RuleExtractor.extract_global_rules(resolved_schema)
+        traverser = SchemaTraverser(resolved_schema)
+        normalizer = Normalizer(resolved_schema, global_rules, traverser)
+
+        entry = _ResolvedSchema(
+            schema_fragment, fingerprint, resolved_schema, traverser, normalizer
+        )
+        cache[key] = entry
+        cache.move_to_end(key)
+        if len(cache) > _SCHEMA_CACHE_SIZE:
+            cache.popitem(last=False)
+        return entry
+
     def _calculate_coverage(
         self,
         old_json: Any,
         new_json: Any,
-        schema: dict,
+        resolved: _ResolvedSchema,
         differ: Differ
     ) -> Coverage:
         """Calculate schema coverage statistics."""
-        schema_fields = self._count_schema_fields(schema)
+        # Counted once per schema fragment, stored with its resolution
+        schema_fields = resolved.field_count
+        if schema_fields is None:
+            schema_fields = resolved.field_count = self._count_schema_fields(resolved.schema)
+
+        old_paths: set = set()
+        new_paths: set = set()
         payload_fields = max(
-            self._count_payload_fields(old_json),
-            self._count_payload_fields(new_json)
+            self._walk_payload(old_json, "$", old_paths),
+            self._walk_payload(new_json, "$", new_paths)
         )
 
         # Find unmatched fields
-        old_paths = self._collect_paths(old_json, "$")
-        new_paths = self._collect_paths(new_json, "$")
 
         unmatched_old = [p for p in old_paths if p not in new_paths]
         unmatched_new = [p for p in new_paths if p not in old_paths]
@@ -248,42 +330,40 @@ class ShadowDiffEngine:
 
         return count
 
-    def _count_payload_fields(self, data: Any, depth: int = 0) -> int:
-        """Count fields in payload."""
-        if depth > 50:
-            return 0
-
-        if isinstance(data, dict):
-            count = len(data)
-            for value in data.values():
-                count += self._count_payload_fields(value, depth + 1)
-            return count
-        elif isinstance(data, list):
-            count = 0
-            for item in data:
-                count += self._count_payload_fields(item, depth + 1)
-            return count
+    def _walk_payload(
+        self,
+        data: Any,
+        path: str,
+        paths: set,
+        depth: int = 0
+    ) -> int:
+        """
+        Count the fields in a payload and collect their paths in one pass.
 
-        return 0
+        Args:
+            data: The payload (or subtree) to walk
+            path: JSONPath of ``data``
+            paths: Set that receives every field path found
+            depth: Current nesting depth
 
-    def _collect_paths(self, data: Any, path: str, depth: int = 0) -> set:
-        """Collect all field paths in data."""
+        Returns:
+            Number of fields in ``data``
+        """
         if depth > 50:
-            return set()
-
-        paths = set()
+            return 0
 
+        count = 0
         if isinstance(data, dict):
+            count = len(data)
             for key, value in data.items():
                 child_path = f"{path}.{key}"
                 paths.add(child_path)
-                paths.update(self._collect_paths(value, child_path, depth + 1))
+                count += self._walk_payload(value, child_path, paths, depth + 1)
         elif isinstance(data, list):
             for i, item in enumerate(data):
-                child_path = f"{path}[{i}]"
-                paths.update(self._collect_paths(item, child_path, depth + 1))
+                count += self._walk_payload(item, f"{path}[{i}]", paths, depth + 1)
 
-        return paths
+        return count
 
     def _create_error_response(
         self,
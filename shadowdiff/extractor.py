@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
+from .models import _SLOTS
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ExtractConfig:
     """Configuration for data extraction from test datasets."""
     input_paths: list[str] = field(default_factory=list)
@@ -28,7 +31,7 @@ class ExtractConfig:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExtractedData:
     """Extracted data from a dataset."""
     input_data: dict[str, Any] = field(default_factory=dict)
@@ -57,6 +60,11 @@ class DataExtractor:
     def __init__(self, config: ExtractConfig):
         self.config = config
 
+        # (display key, extractor function) per configured path, built once
+        self._input_extractors = self._compile_paths(config.input_paths)
+        self._before_extractors = self._compile_paths(config.before_paths)
+        self._after_extractors = self._compile_paths(config.after_paths)
+
     def extract(self, dataset: dict) -> ExtractedData:
         """Extract data from a dataset based on configured paths."""
         result = ExtractedData()
@@ -66,22 +74,23 @@ class DataExtractor:
         after_data = dataset.get('after', {})
 
         # Extract from input
-        for path in self.config.input_paths:
-            key = self._path_to_key(path)
-            result.input_data[key] = self._extract_path(input_data, path)
+        for key, extract_path in self._input_extractors:
+            result.input_data[key] = extract_path(input_data)
 
         # Extract from before
-        for path in self.config.before_paths:
-            key = self._path_to_key(path)
-            result.before_data[key] = self._extract_path(before_data, path)
+        for key, extract_path in self._before_extractors:
+            result.before_data[key] = extract_path(before_data)
 
         # Extract from after
-        for path in self.config.after_paths:
-            key = self._path_to_key(path)
-            result.after_data[key] = self._extract_path(after_data, path)
+        for key, extract_path in self._after_extractors:
+            result.after_data[key] = extract_path(after_data)
 
         return result
 
+    def _compile_paths(self, paths: list[str]) -> list[tuple[str, Callable[[Any], Any]]]:
+        """Compile configured paths into (display key, extractor) pairs."""
+        return [(self._path_to_key(path), compile_extractor(path)) for path in paths]
+
     def _path_to_key(self, path: str) -> str:
         """Convert a path to a display key."""
         # Remove 'root.' prefix if present
@@ -99,67 +108,166 @@ class DataExtractor:
         - Array wildcards: "array[*].field"
         - Multiple wildcards: "array[*].nested[*].field"
         """
-        # Remove 'root.' prefix if present
-        if path.startswith('root.'):
-            path = path[5:]
+        return compile_extractor(path)(data)
 
-        return self._extract_recursive(data, path)
+    @staticmethod
+    def extract_single_path(data: Any, path: str) -> Any:
+        """Convenience method to extract a single path from data."""
+        extractor = DataExtractor(ExtractConfig())
+        return extractor._extract_path(data, path)
 
-    def _extract_recursive(self, data: Any, path: str) -> Any:
-        """Recursively extract values following the path."""
-        if not path:
-            return data
 
-        if data is None:
-            return None
+# Step kinds of a compiled extraction path
+_FIELD = 0
+_WILDCARD = 1
+_INVALID = 2
 
-        # Check for array wildcard
-        wildcard_match = re.match(r'^([^.\[]+)\[\*\](.*)$', path)
-        if wildcard_match:
-            field_name = wildcard_match.group(1)
-            remaining_path = wildcard_match.group(2)
+_WILDCARD_RE = re.compile(r'^([^.\[]+)\[\*\](.*)$')
+_FIELD_RE = re.compile(r'^([^.\[]+)(?:\.(.+))?$')
 
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> tuple[tuple[int, str], ...]:
+    """
+    Parse an extraction path into (kind, field name) steps.
+
+    Args:
+        path: Path expression, e.g. "candidates[*].coverages[*].code"
+
+    Returns:
+        Steps; an unparsable remainder becomes a final _INVALID step
+    """
+    # Remove 'root.' prefix if present
+    if path.startswith('root.'):
+        path = path[5:]
+
+    steps = []
+    while path:
+        # Array wildcard: name[*] followed by the rest of the path
+        match = _WILDCARD_RE.match(path)
+        if match:
+            steps.append((_WILDCARD, match.group(1)))
+            path = match.group(2)
             # Remove leading dot from remaining path
-            if remaining_path.startswith('.'):
-                remaining_path = remaining_path[1:]
-
-            # Get the array
-            if isinstance(data, dict) and field_name in data:
-                array_data = data[field_name]
-                if isinstance(array_data, list):
-                    results = []
-                    for item in array_data:
-                        if remaining_path:
-                            extracted = self._extract_recursive(item, remaining_path)
-                            if isinstance(extracted, list):
-                                results.extend(extracted)
-                            elif extracted is not None:
-                                results.append(extracted)
-                        else:
-                            results.append(item)
-                    return results
-                return None
-            return None
+            if path.startswith('.'):
+                path = path[1:]
+            continue
 
         # Simple field access
-        dot_match = re.match(r'^([^.\[]+)(?:\.(.+))?$', path)
-        if dot_match:
-            field_name = dot_match.group(1)
-            remaining_path = dot_match.group(2) or ''
-
-            if isinstance(data, dict) and field_name in data:
-                if remaining_path:
-                    return self._extract_recursive(data[field_name], remaining_path)
-                return data[field_name]
-            return None
+        match = _FIELD_RE.match(path)
+        if match:
+            steps.append((_FIELD, match.group(1)))
+            path = match.group(2) or ''
+            continue
+
+        steps.append((_INVALID, path))
+        break
+
+    return tuple(steps)
+
 
+@lru_cache(maxsize=1024)
+def compile_extractor(path: str) -> Callable[[Any], Any]:
+    """
+    Compile an extraction path into a function specialized for it.
+
+    Each step becomes a closure calling the next one directly, so extracting
+    involves no parsing or step dispatch.
+
+    Args:
+        path: Path expression, e.g. "candidates[*].coverages[*].code"
+
+    Returns:
+        Function returning the value(s) the path selects from data
+    """
+    steps = _compile_path(path)
+    extract: Callable[[Any], Any] = _identity
+
+    # The common "array[*].leaf" tail gets a single fused loop
+    if len(steps) >= 2 and steps[-2][0] == _WILDCARD and steps[-1][0] == _FIELD:
+        extract = _wildcard_field_step(steps[-2][1], steps[-1][1])
+        steps = steps[:-2]
+
+    for kind, name in reversed(steps):
+        extract = _STEP_BUILDERS[kind](name, extract)
+    return extract
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _invalid_step(name: str, rest: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """An unparsable path selects nothing."""
+    def extract(data: Any) -> Any:
         return None
+    return extract
+
+
+def _field_step(name: str, rest: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Select a field of an object, then apply the rest of the path."""
+    if rest is _identity:
+        def extract(data: Any) -> Any:
+            return data.get(name) if isinstance(data, dict) else None
+    else:
+        def extract(data: Any) -> Any:
+            if isinstance(data, dict):
+                value = data.get(name)
+                if value is not None:
+                    return rest(value)
+            return None
+    return extract
+
+
+def _wildcard_step(name: str, rest: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Select every item of an array field, flattening what the rest selects."""
+    if rest is _identity:
+        def extract(data: Any) -> Any:
+            items = data.get(name) if isinstance(data, dict) else None
+            return list(items) if isinstance(items, list) else None
+    else:
+        def extract(data: Any) -> Any:
+            items = data.get(name) if isinstance(data, dict) else None
+            if not isinstance(items, list):
+                return None
+
+            results = []
+            for item in items:
+                if item is None:
+                    continue
+                extracted = rest(item)
+                if isinstance(extracted, list):
+                    results.extend(extracted)
+                elif extracted is not None:
+                    results.append(extracted)
+            return results
+    return extract
+
+
+def _wildcard_field_step(name: str, leaf: str) -> Callable[[Any], Any]:
+    """Select a field of every item of an array field, flattening list values."""
+    def extract(data: Any) -> Any:
+        items = data.get(name) if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            return None
+
+        results = []
+        for item in items:
+            if isinstance(item, dict):
+                value = item.get(leaf)
+                if isinstance(value, list):
+                    results.extend(value)
+                elif value is not None:
+                    results.append(value)
+        return results
+    return extract
 
-    @staticmethod
-    def extract_single_path(data: Any, path: str) -> Any:
-        """Convenience method to extract a single path from data."""
-        extractor = DataExtractor(ExtractConfig())
-        return extractor._extract_path(data, path)
+
+_STEP_BUILDERS = {
+    _FIELD: _field_step,
+    _WILDCARD: _wildcard_step,
+    _INVALID: _invalid_step,
+}
 
 
 class DataAggregator:
@@ -171,17 +279,24 @@ class DataAggregator:
             aggregate_by: List of paths to aggregate by (e.g., ["condition.type", "status"])
         """
         self.aggregate_by = aggregate_by
-        self.aggregations: dict[str, dict[Any, list[str]]] = {}
+        # (aggregated path, key in extracted before data) per configured path
+        self._agg_keys = [(agg_field, agg_field.replace('[*]', '')) for agg_field in aggregate_by]
+        # Dataset names per value are kept in dicts used as ordered sets, so
+        # repeated additions stay O(1) while preserving insertion order
+        self.aggregations: dict[str, dict[Any, dict[str, None]]] = {}
+        # Report label (str(value)) per aggregated value, computed once when
+        # the value is first seen and reused for sorting and output keys
+        self._value_labels: dict[str, dict[Any, str]] = {}
 
     def add_dataset(self, dataset_name: str, extracted: ExtractedData):
         """Add a dataset's extracted data to the aggregation."""
         # Aggregate by before data
-        for agg_field in self.aggregate_by:
+        for agg_field, key in self._agg_keys:
             if agg_field not in self.aggregations:
                 self.aggregations[agg_field] = {}
+                self._value_labels[agg_field] = {}
 
             # Try to find the field in before_data
-            key = agg_field.replace('[*]', '')
             values = extracted.before_data.get(key)
 
             if values is None:
@@ -205,21 +320,22 @@ class DataAggregator:
         elif isinstance(value, list):
             value = tuple(value) if all(not isinstance(v, (dict, list)) for v in value) else str(value)
 
-        if value not in self.aggregations[field]:
-            self.aggregations[field][value] = []
-
-        if dataset_name not in self.aggregations[field][value]:
-            self.aggregations[field][value].append(dataset_name)
+        datasets = self.aggregations[field].get(value)
+        if datasets is None:
+            datasets = self.aggregations[field][value] = {}
+            self._value_labels[field][value] = str(value)
+        datasets[dataset_name] = None
 
     def get_report(self) -> dict:
         """Get the aggregation report."""
         report = {}
         for field, values in self.aggregations.items():
+            labels = self._value_labels[field]
             report[field] = {
-                str(value): {
+                labels[value]: {
                     "count": len(datasets),
-                    "datasets": datasets
+                    "datasets": list(datasets)
                 }
-                for value, datasets in sorted(values.items(), key=lambda x: str(x[0]))
+                for value, datasets in sorted(values.items(), key=lambda x: labels[x[0]])
             }
         return report
@@ -3,26 +3,79 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Generator, Optional
-from jsonpath_ng import parse as jsonpath_parse
-from jsonpath_ng.exceptions import JsonPathParserError
+from functools import lru_cache
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable, Generator, Optional
+
+
+@lru_cache(maxsize=1024)
+def _compile_jsonpath(path: str):
+    """Parse a JSONPath expression (bounded cache of parsed expressions)."""
+    # jsonpath-ng (and its parser) is only loaded once a path actually needs
+    # it; simple paths are handled without it
+    from jsonpath_ng import parse as jsonpath_parse
+    from jsonpath_ng.exceptions import JsonPathParserError
+
+    try:
+        return jsonpath_parse(path)
+    except JsonPathParserError as e:
+        raise ValueError(f"Invalid JSONPath expression '{path}': {e}")
+
+
+# Paths made only of $, .name and [index] are walked directly, without
+# jsonpath-ng (names must not be jsonpath-ng keywords)
+_SIMPLE_PATH_RE = re.compile(r'^\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*$')
+_SIMPLE_SEGMENT_RE = re.compile(r'\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]')
+_JSONPATH_KEYWORDS = frozenset(('where', 'wherenot'))
+
+# Tokens of a path for set_value: a run of name characters, or a bracketed
+# segment (an unterminated bracket runs to the end); dots are skipped
+_PATH_TOKEN_RE = re.compile(r'([^.\[]+)|\[([^\]]*)\]?')
+
+
+@lru_cache(maxsize=1024)
+def _simple_path_segments(path: str) -> Optional[tuple]:
+    """Split a simple path into field names and indices, or None if not simple."""
+    if not _SIMPLE_PATH_RE.match(path):
+        return None
+
+    segments = []
+    for match in _SIMPLE_SEGMENT_RE.finditer(path):
+        name, index = match.groups()
+        if name is None:
+            segments.append(int(index))
+        elif name in _JSONPATH_KEYWORDS:
+            return None
+        else:
+            segments.append(name)
+    return tuple(segments)
+
+
+def _walk_simple_path(data: Any, segments: tuple) -> tuple[bool, Any]:
+    """Follow simple path segments; returns (found, value)."""
+    for segment in segments:
+        if isinstance(segment, int):
+            # Like jsonpath-ng, indices apply to any non-empty sequence
+            # (including strings) but never to mappings
+            if isinstance(data, dict) or not isinstance(data, (list, str, tuple)) \
+                    or segment >= len(data):
+                return False, None
+        elif not isinstance(data, dict) or segment not in data:
+            return False, None
+        data = data[segment]
+    return True, data
 
 
 class JSONPathMatcher:
     """Utility class for JSONPath matching and manipulation."""
 
-    # Cache for compiled JSONPath expressions
-    _cache: dict = {}
+    # Clears the cache of compiled expressions
+    cache_clear = staticmethod(_compile_jsonpath.cache_clear)
 
     @classmethod
     def compile(cls, path: str):
         """Compile and cache a JSONPath expression."""
-        if path not in cls._cache:
-            try:
-                cls._cache[path] = jsonpath_parse(path)
-            except JsonPathParserError as e:
-                raise ValueError(f"Invalid JSONPath expression '{path}': {e}")
-        return cls._cache[path]
+        return _compile_jsonpath(path)
 
     @classmethod
     def find_all(cls, data: Any, path: str) -> list[tuple[str, Any]]:
@@ -32,6 +85,16 @@ class JSONPathMatcher:
         Returns:
             List of (full_path, value) tuples
         """
+        segments = _simple_path_segments(path)
+        if segments is not None:
+            found, value = _walk_simple_path(data, segments)
+            if not found:
+                return []
+            full_path = '.'.join(
+                f"[{s}]" if isinstance(s, int) else s for s in segments
+            ) or '$'
+            return [(full_path, value)]
+
         try:
             expr = cls.compile(path)
             matches = expr.find(data)
@@ -42,6 +105,11 @@ class JSONPathMatcher:
     @classmethod
     def find_values(cls, data: Any, path: str) -> list[Any]:
         """Find all values matching a JSONPath expression."""
+        segments = _simple_path_segments(path)
+        if segments is not None:
+            found, value = _walk_simple_path(data, segments)
+            return [value] if found else []
+
         try:
             expr = cls.compile(path)
             return [m.value for m in expr.find(data)]
@@ -61,9 +129,26 @@ class JSONPathMatcher:
             Modified data
         """
         for path in paths:
-            data = cls._delete_path(data, path)
+            segments = _simple_path_segments(path)
+            if segments is None:
+                data = cls._delete_path(data, path)
+            else:
+                cls._delete_simple_path(data, segments)
         return data
 
+    @classmethod
+    def _delete_simple_path(cls, data: Any, segments: tuple) -> None:
+        """Delete a simple path from data without going through jsonpath-ng."""
+        # Same outcome as _delete_path: jsonpath-ng reports no parent for
+        # top-level matches and index matches are never removed there, so
+        # only object fields below the root are deleted
+        if len(segments) < 2 or isinstance(segments[-1], int):
+            return
+
+        found, parent = _walk_simple_path(data, segments[:-1])
+        if found and isinstance(parent, dict):
+            parent.pop(segments[-1], None)
+
     @classmethod
     def _delete_path(cls, data: Any, path: str) -> Any:
         """Delete a single JSONPath from data."""
@@ -148,42 +233,19 @@ class JSONPathMatcher:
             path = path[1:]
 
         segments = []
-        current = ''
-        i = 0
-
-        while i < len(path):
-            char = path[i]
-
-            if char == '.':
-                if current:
-                    segments.append(current)
-                    current = ''
-            elif char == '[':
-                if current:
-                    segments.append(current)
-                    current = ''
-                # Find matching ]
-                j = i + 1
-                while j < len(path) and path[j] != ']':
-                    j += 1
-                bracket_content = path[i + 1:j]
-                # Check if it's a number or quoted string
-                if bracket_content.isdigit():
-                    segments.append(int(bracket_content))
-                elif bracket_content.startswith("'") and bracket_content.endswith("'"):
-                    segments.append(bracket_content[1:-1])
-                elif bracket_content.startswith('"') and bracket_content.endswith('"'):
-                    segments.append(bracket_content[1:-1])
-                else:
-                    segments.append(bracket_content)
-                i = j
+        for match in _PATH_TOKEN_RE.finditer(path):
+            name, bracket_content = match.groups()
+            if name is not None:
+                segments.append(name)
+            # Check if it's a number or quoted string
+            elif bracket_content.isdigit():
+                segments.append(int(bracket_content))
+            elif bracket_content.startswith("'") and bracket_content.endswith("'"):
+                segments.append(bracket_content[1:-1])
+            elif bracket_content.startswith('"') and bracket_content.endswith('"'):
+                segments.append(bracket_content[1:-1])
             else:
-                current += char
-
-            i += 1
-
-        if current:
-            segments.append(current)
+                segments.append(bracket_content)
 
         return segments
 
@@ -197,28 +259,30 @@ class JSONPathMatcher:
         - Recursive descent: $..field
         - Wildcard: $.items[*].name
         """
-        # Handle recursive descent patterns
+        # Handle recursive descent patterns: $..field matches any path
+        # ending with .field
         if '..' in pattern:
-            # Convert $..field to regex that matches any path ending with .field
             field = pattern.split('..')[-1]
-            field_escaped = re.escape(field)
-            regex = rf'.*\.{field_escaped}$|^\$\.{field_escaped}$'
-            return bool(re.match(regex, concrete_path))
+            return concrete_path.endswith('.' + field)
 
         # Handle wildcards
         if '[*]' in pattern or '.*' in pattern:
-            # Convert to regex
-            regex_pattern = pattern
-            regex_pattern = regex_pattern.replace('.', r'\.')
-            regex_pattern = regex_pattern.replace('[*]', r'\[\d+\]')
-            regex_pattern = regex_pattern.replace('*', r'[^.]+')
-            regex_pattern = f'^{regex_pattern}$'
-            return bool(re.match(regex_pattern, concrete_path))
+            return _wildcard_pattern_regex(pattern).match(concrete_path) is not None
 
         # Exact match
         return concrete_path == pattern
 
 
+@lru_cache(maxsize=512)
+def _wildcard_pattern_regex(pattern: str) -> re.Pattern:
+    """Compile a wildcard path pattern (see ``matches_pattern``) to a regex."""
+    regex_pattern = pattern
+    regex_pattern = regex_pattern.replace('.', r'\.')
+    regex_pattern = regex_pattern.replace('[*]', r'\[\d+\]')
+    regex_pattern = regex_pattern.replace('*', r'[^.]+')
+    return re.compile(f'^{regex_pattern}$')
+
+
 def evaluate_condition(data: Any, condition: str) -> bool:
     """
     Evaluate a simple JSONPath condition.
@@ -241,6 +305,20 @@ def evaluate_condition(data: Any, condition: str) -> bool:
     if not condition:
         return True
 
+    return compile_condition(condition)(data)
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Callable[[Any], bool]:
+    """
+    Parse a condition once into a predicate (see ``evaluate_condition``).
+
+    Args:
+        condition: The condition string
+
+    Returns:
+        Function evaluating the condition against a data object
+    """
     # Parse the condition
     operators = ['==', '!=', '>=', '<=', '>', '<']
     operator = None
@@ -250,11 +328,11 @@ def evaluate_condition(data: Any, condition: str) -> bool:
             break
 
     if not operator:
-        return True
+        return _always_true
 
     parts = condition.split(operator, 1)
     if len(parts) != 2:
-        return True
+        return _always_true
 
     path = parts[0].strip()
     expected = parts[1].strip()
@@ -278,28 +356,66 @@ def evaluate_condition(data: Any, condition: str) -> bool:
         except ValueError:
             pass
 
-    # Get actual value
-    values = JSONPathMatcher.find_values(data, path)
-    if not values:
-        return False
+    compare = _CONDITION_OPERATORS[operator]
+    find_first = _compile_first_value_finder(path)
+
+    def predicate(data: Any) -> bool:
+        # Get actual value
+        found, actual = find_first(data)
+        if not found:
+            return False
+
+        # Compare
+        try:
+            return compare(actual, expected)
+        except TypeError:
+            return False
+
+    return predicate
+
 
-    actual = values[0]
+def _compile_first_value_finder(path: str) -> Callable[[Any], tuple[bool, Any]]:
+    """
+    Resolve a JSONPath once into a function returning its first match.
+
+    Args:
+        path: The JSONPath expression
+
+    Returns:
+        Function returning (found, value) for a data object
+    """
+    segments = _simple_path_segments(path)
+    if segments is not None:
+        return lambda data: _walk_simple_path(data, segments)
 
-    # Compare
     try:
-        if operator == '==':
-            return actual == expected
-        elif operator == '!=':
-            return actual != expected
-        elif operator == '>':
-            return actual > expected
-        elif operator == '<':
-            return actual < expected
-        elif operator == '>=':
-            return actual >= expected
-        elif operator == '<=':
-            return actual <= expected
-    except TypeError:
-        return False
+        expr = JSONPathMatcher.compile(path)
+    except ValueError:
+        # Invalid expressions never match (as in find_values)
+        return lambda data: (False, None)
 
+    def find_first(data: Any) -> tuple[bool, Any]:
+        try:
+            matches = expr.find(data)
+        except Exception:
+            return False, None
+        if not matches:
+            return False, None
+        return True, matches[0].value
+
+    return find_first
+
+
+def _always_true(data: Any) -> bool:
+    """Predicate for conditions without a recognized operator."""
     return True
+
+
+_CONDITION_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    '==': eq,
+    '!=': ne,
+    '>': gt,
+    '<': lt,
+    '>=': ge,
+    '<=': le,
+}
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from typing import Any
-from copy import deepcopy
 
 from .models import FieldRules, MigrationStrategy
 from .schema import SchemaTraverser
 
 
+# Returned by Masker._mask_tree for fields removed by the ignore strategy
+_IGNORED = object()
+
+
 class Masker:
     """
     Applies masking rules to filter out ignored fields.
@@ -21,6 +24,9 @@ class Masker:
     def __init__(self, traverser: SchemaTraverser):
         self.traverser = traverser
         self.ignored_count = 0
+        # Rules per (path, id(parent_rules)); entries keep parent_rules so a
+        # reused id can be detected
+        self._rules_cache: dict[tuple[str, int], tuple[FieldRules | None, FieldRules]] = {}
 
     def mask(
         self,
@@ -39,46 +45,89 @@ class Masker:
         """
         self.ignored_count = 0
 
-        old = self._mask_recursive(deepcopy(old_json), "$", None)
-        new = self._mask_recursive(deepcopy(new_json), "$", None)
+        # _mask_tree builds new containers and never mutates values, so the
+        # inputs need no defensive copy (leaves are shared)
+        old = self._mask_tree(old_json)
+        new = self._mask_tree(new_json)
 
-        return old, new, self.ignored_count
+        return (
+            None if old is _IGNORED else old,
+            None if new is _IGNORED else new,
+            self.ignored_count
+        )
 
-    def _mask_recursive(
-        self,
-        data: Any,
-        path: str,
-        parent_rules: FieldRules | None
-    ) -> Any:
-        """Recursively apply masking rules."""
-        rules = self.traverser.get_rules_for_path(path, parent_rules)
+    def _mask_tree(self, data: Any) -> Any:
+        """
+        Apply masking rules to a whole payload.
 
-        # Check if this field should be ignored
-        if rules.strategy == MigrationStrategy.IGNORE:
-            self.ignored_count += 1
-            return None  # Signal to remove this field
+        Containers are copied with an explicit stack rather than recursion:
+        each copy is attached to its parent when created and filled in when
+        popped.
 
-        if isinstance(data, dict):
-            result = {}
-            for key, value in data.items():
-                child_path = f"{path}.{key}"
-                masked_value = self._mask_recursive(value, child_path, rules)
-                if masked_value is not None or not self._was_ignored(child_path):
-                    result[key] = masked_value
-            return result
-
-        elif isinstance(data, list):
-            result = []
-            for i, item in enumerate(data):
-                child_path = f"{path}[{i}]"
-                masked_value = self._mask_recursive(item, child_path, rules)
+        Returns the masked value, or _IGNORED if the root must be removed.
+        """
+        rules = self._get_rules("$", None)
+        masked = self._mask_node(data, rules)
+        if masked is _IGNORED or masked is data:
+            return masked
+
+        stack = [(data, masked, "$", rules)]
+        while stack:
+            source, target, path, rules = stack.pop()
+
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    child_path = f"{path}.{key}"
+                    child_rules = self._get_rules(child_path, rules)
+                    child = self._mask_node(value, child_rules)
+                    if child is _IGNORED:
+                        continue
+                    target[key] = child
+                    if child is not value:
+                        stack.append((value, child, child_path, child_rules))
+                continue
+
+            # Schema rules do not depend on the index, so every item is
+            # resolved through the same path and rules
+            item_path = f"{path}[0]"
+            item_rules = self._get_rules(item_path, rules)
+            if item_rules.strategy == MigrationStrategy.IGNORE:
                 # For arrays, we keep the structure but masked content
-                result.append(masked_value)
-            return result
+                self.ignored_count += len(source)
+                target.extend([None] * len(source))
+                continue
+            for item in source:
+                child = self._mask_node(item, item_rules)
+                target.append(child)
+                if child is not item:
+                    stack.append((item, child, item_path, item_rules))
+
+        return masked
+
+    def _mask_node(self, data: Any, rules: FieldRules) -> Any:
+        """
+        Start masking a single value.
 
+        Returns _IGNORED if the field must be removed, an empty container of
+        the same kind for objects and arrays (to be filled by _mask_tree), or
+        the value itself for leaves.
+        """
+        if rules.strategy == MigrationStrategy.IGNORE:
+            self.ignored_count += 1
+            return _IGNORED
+        if isinstance(data, dict):
+            return {}
+        if isinstance(data, list):
+            return []
         return data
 
-    def _was_ignored(self, path: str) -> bool:
-        """Check if a path was ignored due to strategy."""
-        rules = self.traverser.get_rules_for_path(path, None)
-        return rules.strategy == MigrationStrategy.IGNORE
+    def _get_rules(self, path: str, parent_rules: FieldRules | None) -> FieldRules:
+        """Get the rules for a path, memoized for the lifetime of this masker."""
+        key = (path, id(parent_rules))
+        entry = self._rules_cache.get(key)
+        if entry is not None and entry[0] is parent_rules:
+            return entry[1]
+
+        rules = self.traverser.get_rules_for_path(path, parent_rules)
+        self._rules_cache[key] = (parent_rules, rules)
+        return rules
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import re
+import sys
+import weakref
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Callable, Optional
 from datetime import datetime
 
+from .utils import compile_pattern, get_cast_function, dumps_json
+
+
+# Options for dataclasses created in bulk (report entries, per-dataset
+# records): slots drop the per-instance __dict__ where supported
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class LogLevel(Enum):
     DEBUG = "DEBUG"
@@ -36,6 +47,14 @@ class Severity(Enum):
     INFO = "INFO"
 
 
+# Enum .value goes through a descriptor; report serialisation reads it for
+# every entry, so look the strings up in plain dicts instead. The values are
+# identifier-like literals, which are interned already, so every serialised
+# entry shares the same string objects
+_DIFF_TYPE_VALUES: dict[DiffType, str] = {m: m.value for m in DiffType}
+_SEVERITY_VALUES: dict[Severity, str] = {m: m.value for m in Severity}
+
+
 class MigrationStrategy(Enum):
     STRICT = "strict"
     IGNORE = "ignore"
@@ -76,7 +95,7 @@ class EngineConfig:
     fail_fast: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DiffEntry:
     """A single difference found during comparison."""
     path: str
@@ -90,8 +109,8 @@ class DiffEntry:
     def to_dict(self) -> dict:
         return {
             "path": self.path,
-            "type": self.type.value,
-            "severity": self.severity.value,
+            "type": _DIFF_TYPE_VALUES[self.type],
+            "severity": _SEVERITY_VALUES[self.severity],
             "old_value": self.old_value,
             "new_value": self.new_value,
             "message": self.message,
@@ -99,7 +118,7 @@ class DiffEntry:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WarningEntry:
     """A warning generated during comparison."""
     path: str
@@ -110,13 +129,13 @@ class WarningEntry:
     def to_dict(self) -> dict:
         return {
             "path": self.path,
-            "type": self.type.value,
-            "severity": self.severity.value,
+            "type": _DIFF_TYPE_VALUES[self.type],
+            "severity": _SEVERITY_VALUES[self.severity],
             "message": self.message,
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TraceEntry:
     """Trace entry for rule application (when trace_rule_application=true)."""
     path: str
@@ -200,15 +219,27 @@ class DiffReport:
             "is_match": self.is_match,
             "execution": self.execution.to_dict(),
             "summary": self.summary.to_dict(),
-            "diffs": [d.to_dict() for d in self.diffs],
-            "warnings": [w.to_dict() for w in self.warnings],
+            "diffs": list(map(DiffEntry.to_dict, self.diffs)),
+            "warnings": list(map(WarningEntry.to_dict, self.warnings)),
         }
         if self.coverage:
             result["coverage"] = self.coverage.to_dict()
         if self.trace:
-            result["trace"] = [t.to_dict() for t in self.trace]
+            result["trace"] = list(map(TraceEntry.to_dict, self.trace))
         return result
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the report (as described by to_dict) to compact JSON.
+
+        Uses orjson when it is installed and the report has nothing it
+        would reject or change (see utils.dumps_json).
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return dumps_json(self.to_dict())
+
 
 @dataclass
 class FieldRules:
@@ -222,6 +253,7 @@ class FieldRules:
     pattern: Optional[str] = None
     datetime_format: Optional[str] = None
     datetime_tolerance: Optional[str] = None
+    datetime_tolerance_seconds: Optional[float] = None
     default: Any = None
     has_default: bool = False
     enum_map: Optional[dict] = None
@@ -237,8 +269,95 @@ class FieldRules:
     inherit_rules: bool = False
     when_condition: Optional[str] = None
 
-
-@dataclass
+    @classmethod
+    def canonical(cls, rules: FieldRules) -> FieldRules:
+        """
+        Return the shared instance for a rule set.
+
+        Equal rule sets collapse to one object while any is in use, so
+        identity implies equality and per-rules caches are shared across
+        schema nodes. Canonical instances must not be mutated.
+
+        Args:
+            rules: The extracted rules
+
+        Returns:
+            The interned FieldRules equal to ``rules``
+        """
+        try:
+            key = tuple(_freeze(getattr(rules, f.name)) for f in fields(cls))
+            return _RULES_INTERN.setdefault(key, rules)
+        except TypeError:
+            # Unhashable rule value - keep the rules object as is
+            return rules
+
+    @cached_property
+    def _string_transform(self) -> Callable[[str], str]:
+        """String normalization applied before comparing string values."""
+        if self.trim_whitespace and self.case_insensitive:
+            return _strip_lower
+        if self.trim_whitespace:
+            return str.strip
+        if self.case_insensitive:
+            return str.lower
+        return str
+
+    @cached_property
+    def _compare_fn(self) -> Callable[[Any, Any], tuple[bool, str]]:
+        """Scalar comparator specialized for these rules (see ``compile_rules``)."""
+        # Imported lazily: the comparators module depends on this one
+        from .comparators import compile_rules
+        return compile_rules(self)
+
+    @cached_property
+    def _mismatch_info(self) -> tuple[DiffType, Optional[str]]:
+        """Diff type and applied-rule text reported when a scalar mismatches."""
+        if self.precision is not None:
+            return DiffType.PRECISION_EXCEEDED, f"x-migration-precision: {self.precision}"
+        if self.pattern is not None:
+            return DiffType.PATTERN_MISMATCH, f"x-migration-pattern: {self.pattern}"
+        if self.datetime_tolerance is not None:
+            return (DiffType.DATETIME_EXCEEDED,
+                    f"x-migration-datetime-tolerance: {self.datetime_tolerance}")
+        return DiffType.VALUE_MISMATCH, None
+
+    @cached_property
+    def _cast_fn(self) -> Optional[Callable[[Any], Any]]:
+        """Function applying x-migration-cast, or None without a cast."""
+        return get_cast_function(self.cast.value) if self.cast else None
+
+    @cached_property
+    def _compiled_pattern(self) -> Optional[re.Pattern]:
+        """Compiled x-migration-pattern (raises re.error if invalid)."""
+        return compile_pattern(self.pattern) if self.pattern else None
+
+    @cached_property
+    def _pattern_fullmatch(self) -> Optional[Callable[[str], Optional[re.Match]]]:
+        """Bound ``fullmatch`` of the compiled pattern (raises re.error if invalid)."""
+        pattern = self._compiled_pattern
+        return pattern.fullmatch if pattern is not None else None
+
+
+# Interned FieldRules instances keyed by their frozen field values; held
+# weakly, so a rule set lives only as long as a schema cache using it
+_RULES_INTERN: weakref.WeakValueDictionary[tuple, FieldRules] = weakref.WeakValueDictionary()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a rule value into a hashable key (types kept distinct)."""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _strip_lower(value: str) -> str:
+    """Trim whitespace and lowercase a string."""
+    return value.strip().lower()
+
+
+@dataclass(**_SLOTS)
 class GlobalRules:
     """Global migration rules from schema root."""
     global_ignores: list[str] = field(default_factory=list)
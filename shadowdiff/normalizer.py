@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
-from copy import deepcopy
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Optional
 
 from .models import GlobalRules, FieldRules, ArrayMode, DuplicateHandling
 from .schema import SchemaTraverser
@@ -11,6 +13,38 @@ from .jsonpath_utils import JSONPathMatcher
 from .utils import extract_key_value, merge_dicts
 
 
+def _copy_containers(data: Any) -> Any:
+    """Copy the dicts and lists of a JSON value (leaves are shared)."""
+    if isinstance(data, dict):
+        return {key: _copy_containers(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_containers(item) for item in data]
+    return data
+
+
+def _is_recursive_ignore(pattern: str) -> bool:
+    """Whether a global ignore is a recursive descent pattern ($..field)."""
+    return '..' in pattern
+
+
+def _recursive_ignore_fields(patterns: Iterable[str]) -> frozenset[str]:
+    """Field names recursive descent ignores ($..field) delete."""
+    fields = set()
+    for pattern in patterns:
+        parts = pattern.split('..')
+        if len(parts) != 2:
+            continue
+
+        field_name = parts[1].lstrip('.')
+
+        # Handle array notation like ['@odata.context']
+        if field_name.startswith('[') and field_name.endswith(']'):
+            field_name = field_name[2:-2]  # Remove [' and ']
+
+        fields.add(field_name)
+    return frozenset(fields)
+
+
 class Normalizer:
     """
     Normalizes payloads according to schema rules.
@@ -33,6 +67,15 @@ class Normalizer:
         self.schema = schema
         self.global_rules = global_rules
         self.traverser = traverser
+        # Per schema node (by id, keeping the node): alias -> property name
+        # of its properties, and (property name, default) pairs
+        self._aliases_cache: dict[int, tuple[dict, dict]] = {}
+        self._defaults_cache: dict[int, tuple[dict, list[tuple[str, Any]]]] = {}
+        # Field names deleted everywhere by $..field global ignores
+        self._ignored_fields: frozenset[str] = frozenset()
+        # Whether any payload-wide scrubbing (ignores, nulls, empty strings)
+        # applies
+        self._scrubbing = False
 
     def normalize(
         self,
@@ -49,262 +92,353 @@ class Normalizer:
         Returns:
             Tuple of (normalized_old, normalized_new)
         """
-        old = deepcopy(old_json)
-        new = deepcopy(new_json)
-
-        # Stage 2.1: Apply global ignores
-        old = self._apply_global_ignores(old)
-        new = self._apply_global_ignores(new)
-
-        # Stage 2.2: Apply alias resolution (old payload only)
-        old = self._apply_aliases(old, "$")
-
-        # Stage 2.3: Apply null-as-missing normalization
-        if self.global_rules.allow_null_as_missing:
-            old = self._normalize_nulls(old)
-            new = self._normalize_nulls(new)
-
-        # Stage 2.4: Apply empty-string-as-null normalization
-        if self.global_rules.empty_string_as_null:
-            old = self._normalize_empty_strings(old)
-            new = self._normalize_empty_strings(new)
-
-        # Stage 2.5: Apply default injection
-        old = self._apply_defaults(old, "$")
-        new = self._apply_defaults(new, "$")
-
-        # Stage 2.6: Apply enum mapping (old payload only)
-        old = self._apply_enum_mapping(old, "$")
+        # The walk builds new containers instead of modifying its input, so
+        # the payloads need no defensive copy (leaves are shared)
+        old, new = old_json, new_json
+
+        # Stage 2.1: Apply global ignores. $..field ignores are applied during
+        # the walk; any other JSONPath needs its own pass first
+        ignores = self.global_rules.global_ignores
+        if all(map(_is_recursive_ignore, ignores)):
+            self._ignored_fields = _recursive_ignore_fields(ignores)
+        else:
+            old = self._apply_global_ignores(old)
+            new = self._apply_global_ignores(new)
+            self._ignored_fields = frozenset()
+
+        self._scrubbing = bool(
+            self._ignored_fields
+            or self.global_rules.allow_null_as_missing
+            or self.global_rules.empty_string_as_null
+        )
 
-        # Stage 2.7: Apply array sorting
-        old = self._apply_array_sorting(old, "$")
-        new = self._apply_array_sorting(new, "$")
+        # Stages 2.2-2.7 in a single walk per payload: aliases (old only),
+        # null-as-missing, empty-string-as-null, defaults, enum mapping
+        # (old only) and array sorting
+        root = self.traverser.get_schema_for_path('$')
+        old = self._normalize_value(old, root, root, True, True, True)
+        new = self._normalize_value(new, root, None, True, True, False)
 
         return old, new
 
-    def _apply_global_ignores(self, data: Any) -> Any:
-        """Delete all paths matching global ignores."""
-        if not self.global_rules.global_ignores:
-            return data
-
-        for ignore_path in self.global_rules.global_ignores:
-            data = self._delete_jsonpath(data, ignore_path)
-
-        return data
-
-    def _delete_jsonpath(self, data: Any, path: str) -> Any:
-        """Delete nodes matching a JSONPath pattern."""
-        # Handle recursive descent pattern $..field
-        if '..' in path:
-            return self._delete_recursive(data, path)
-
-        # Use JSONPathMatcher for standard patterns
-        return JSONPathMatcher.delete_paths(data, [path])
-
-    def _delete_recursive(self, data: Any, pattern: str) -> Any:
-        """Delete fields matching recursive descent pattern."""
-        # Extract the field name from $..field pattern
-        if '..' not in pattern:
-            return data
-
-        parts = pattern.split('..')
-        if len(parts) != 2:
-            return data
+    def _normalize_value(
+        self,
+        data: Any,
+        schema_node: Optional[dict],
+        alias_node: Optional[dict],
+        scrub: bool,
+        defaults: bool,
+        enum: bool
+    ) -> Any:
+        """
+        Apply the normalization stages to a value and everything below it.
 
-        field_name = parts[1].lstrip('.')
+        The walk follows the schema alongside the payload, so every value's
+        schema node is found in a single step from its parent's.
 
-        # Handle array notation like ['@odata.context']
-        if field_name.startswith('[') and field_name.endswith(']'):
-            field_name = field_name[2:-2]  # Remove [' and ']
+        Args:
+            data: The value to normalize
+            schema_node: Schema node of the value (after alias renames)
+            alias_node: Schema node used to resolve aliases (reached through
+                the keys as they were before renaming), or None to apply no
+                aliases
+            scrub: Whether to apply global ignores, null-as-missing and
+                empty-string-as-null (not done inside injected defaults)
+            defaults: Whether to inject defaults
+            enum: Whether to apply enum mappings
 
-        return self._delete_field_recursive(data, field_name)
+        Returns:
+            The normalized value (subtrees with nothing to change may be
+            shared with the input)
+        """
+        if isinstance(data, (dict, list)):
+            # Skip the schema-driven stages where the schema declares no
+            # rules, leaving only the payload-wide scrubbing
+            if not self._has_rules_at(data, schema_node, alias_node):
+                return self._scrub(data) if scrub and self._scrubbing else data
 
-    def _delete_field_recursive(self, data: Any, field: str) -> Any:
-        """Recursively delete a field from nested structures."""
-        if isinstance(data, dict):
-            # Delete the field if present
-            if field in data:
-                del data[field]
+            if isinstance(data, dict):
+                return self._normalize_object(data, schema_node, alias_node, scrub, defaults, enum)
+            return self._normalize_array(data, schema_node, alias_node, scrub, defaults, enum)
 
-            # Recurse into remaining values
-            for key in list(data.keys()):
-                data[key] = self._delete_field_recursive(data[key], field)
+        # Empty strings become null
+        if scrub and self.global_rules.empty_string_as_null and isinstance(data, str) and data == "":
+            data = None
 
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                data[i] = self._delete_field_recursive(item, field)
+        if enum and schema_node:
+            enum_map = schema_node.get('x-migration-enum-map')
+            if enum_map and data in enum_map:
+                # A mapped value is past every other stage but sorting
+                return self._normalize_value(enum_map[data], schema_node, None, False, False, False)
 
         return data
 
-    def _apply_aliases(self, data: Any, path: str) -> Any:
-        """Apply alias mappings to rename fields in old payload."""
-        if not isinstance(data, dict):
-            if isinstance(data, list):
+    def _has_rules_at(
+        self,
+        data: Any,
+        schema_node: Optional[dict],
+        alias_node: Optional[dict]
+    ) -> bool:
+        """Check whether any schema rule can apply to a container or below it."""
+        has_rules_below = self.traverser.has_rules_below
+        if has_rules_below(schema_node):
+            return True
+
+        # Rules on the node itself only matter for sorting an array
+        if isinstance(data, list) and schema_node and schema_node.get('x-migration-order-by'):
+            return True
+
+        return alias_node is not None and alias_node is not schema_node and has_rules_below(alias_node)
+
+    def _scrub(self, data: Any) -> Any:
+        """Apply only global ignores, null-as-missing and empty-string-as-null."""
+        ignored = self._ignored_fields
+        drop_nulls = self.global_rules.allow_null_as_missing
+        empty_as_null = self.global_rules.empty_string_as_null
+
+        def scrub(value: Any) -> Any:
+            # One pass applies all three; scalars are handled inline
+            if isinstance(value, dict):
+                result = {}
+                for key, child in value.items():
+                    if key in ignored or (drop_nulls and child is None):
+                        continue
+                    if isinstance(child, (dict, list)):
+                        child = scrub(child)
+                    elif empty_as_null and child == "":
+                        child = None
+                    result[key] = child
+                return result
+
+            if isinstance(value, list):
                 return [
-                    self._apply_aliases(item, f"{path}[{i}]")
-                    for i, item in enumerate(data)
+                    scrub(item) if isinstance(item, (dict, list))
+                    else None if empty_as_null and item == "" else item
+                    for item in value
                 ]
-            return data
 
-        result = {}
-        for key, value in data.items():
-            child_path = f"{path}.{key}"
-            schema_node = self.traverser.get_schema_for_path(child_path)
-
-            # Check all schema properties for aliases pointing to this key
-            new_key = key
-            if schema_node is None:
-                # Look for alias in parent schema
-                parent_schema = self.traverser.get_schema_for_path(path)
-                if parent_schema and 'properties' in parent_schema:
-                    for prop_name, prop_schema in parent_schema['properties'].items():
-                        alias = prop_schema.get('x-migration-alias')
-                        if alias == key:
-                            new_key = prop_name
-                            break
-
-            # Recursively process the value
-            result[new_key] = self._apply_aliases(value, child_path)
+            # Empty strings become null
+            if empty_as_null and isinstance(value, str) and value == "":
+                return None
+            return value
 
-        return result
+        return scrub(data)
 
-    def _normalize_nulls(self, data: Any) -> Any:
-        """Remove null values (treat null as missing)."""
-        if isinstance(data, dict):
-            return {
-                k: self._normalize_nulls(v)
-                for k, v in data.items()
-                if v is not None
-            }
-        elif isinstance(data, list):
-            return [self._normalize_nulls(item) for item in data]
-        return data
-
-    def _normalize_empty_strings(self, data: Any) -> Any:
-        """Convert empty strings to null."""
-        if isinstance(data, dict):
-            return {
-                k: self._normalize_empty_strings(v)
-                for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._normalize_empty_strings(item) for item in data]
-        elif isinstance(data, str) and data == "":
-            return None
-        return data
-
-    def _apply_defaults(self, data: Any, path: str) -> Any:
-        """Inject default values for missing fields."""
-        schema_node = self.traverser.get_schema_for_path(path)
+    def _normalize_object(
+        self,
+        data: dict,
+        schema_node: Optional[dict],
+        alias_node: Optional[dict],
+        scrub: bool,
+        defaults: bool,
+        enum: bool
+    ) -> dict:
+        """Normalize an object (see _normalize_value)."""
+        property_schema = self.traverser.get_property_schema
+
+        items = data.items()
+        ignored = self._ignored_fields
+        # Most objects have none of the ignored fields; that check runs in C
+        if scrub and ignored and not ignored.isdisjoint(data):
+            items = [(key, value) for key, value in items if key not in ignored]
+
+        # Rename aliased keys first: a renamed key replaces an existing one in
+        # place, before nulls are dropped
+        if alias_node is not None:
+            # Look for aliases in the parent schema
+            aliases = self._aliases_for(alias_node) if alias_node else {}
+            renamed = {}
+            for key, value in items:
+                child_alias_node = property_schema(alias_node, key)
+                new_key = key
+                if aliases and child_alias_node is None:
+                    new_key = aliases.get(key, key)
+                renamed[new_key] = (value, child_alias_node)
+            entries = [(key, value, child_alias_node) for key, (value, child_alias_node) in renamed.items()]
+        else:
+            entries = [(key, value, None) for key, value in items]
+
+        # Defaults are only injected below nodes the schema describes
+        defaults = defaults and schema_node is not None
+
+        drop_nulls = scrub and self.global_rules.allow_null_as_missing
+        empty_as_null = scrub and self.global_rules.empty_string_as_null
+        result = {}
+        for key, value, child_alias_node in entries:
+            if drop_nulls and value is None:
+                continue
+            # Scalars with no enum mapping to apply are handled inline
+            if enum or isinstance(value, (dict, list)):
+                value = self._normalize_value(
+                    value, property_schema(schema_node, key), child_alias_node, scrub, defaults, enum
+                )
+            elif empty_as_null and value == "":
+                value = None
+            result[key] = value
+
+        # Add missing properties with defaults
+        if defaults:
+            for prop_name, default in self._defaults_for(schema_node):
+                if prop_name not in result:
+                    result[prop_name] = self._normalize_value(
+                        default, property_schema(schema_node, prop_name), None, False, True, enum
+                    )
 
-        if schema_node is None:
-            return data
+        return result
 
-        if isinstance(data, dict):
-            # Check for missing properties with defaults
-            if 'properties' in schema_node:
-                for prop_name, prop_schema in schema_node['properties'].items():
-                    if prop_name not in data:
-                        if 'x-migration-default' in prop_schema:
-                            data[prop_name] = prop_schema['x-migration-default']
-
-            # Recurse into existing properties
-            result = {}
-            for key, value in data.items():
-                child_path = f"{path}.{key}"
-                result[key] = self._apply_defaults(value, child_path)
-            return result
-
-        elif isinstance(data, list):
-            return [
-                self._apply_defaults(item, f"{path}[{i}]")
-                for i, item in enumerate(data)
+    def _normalize_array(
+        self,
+        data: list,
+        schema_node: Optional[dict],
+        alias_node: Optional[dict],
+        scrub: bool,
+        defaults: bool,
+        enum: bool
+    ) -> list:
+        """Normalize an array, then sort it by its order-by (see _normalize_value)."""
+        items_schema = self.traverser.get_items_schema
+        item_node = items_schema(schema_node)
+        item_alias_node = items_schema(alias_node) if alias_node is not None else None
+        defaults = defaults and schema_node is not None
+        if enum or not all(isinstance(item, (str, int, float, bool)) or item is None for item in data):
+            result = [
+                self._normalize_value(item, item_node, item_alias_node, scrub, defaults, enum)
+                for item in data
             ]
+        elif scrub and self.global_rules.empty_string_as_null:
+            # Arrays of scalars only need empty strings turned into null
+            result = [None if item == "" else item for item in data]
+        else:
+            result = list(data)
+
+        order_by = schema_node.get('x-migration-order-by') if schema_node else None
+        if order_by:
+            result = self._sort_array(result, order_by)
+        return result
 
-        return data
+    def _apply_global_ignores(self, data: Any) -> Any:
+        """Delete all paths matching global ignores."""
+        if not self.global_rules.global_ignores:
+            return data
 
-    def _apply_enum_mapping(self, data: Any, path: str) -> Any:
-        """Apply enum value mappings to old payload."""
-        schema_node = self.traverser.get_schema_for_path(path)
-
-        if isinstance(data, dict):
-            result = {}
-            for key, value in data.items():
-                child_path = f"{path}.{key}"
-                result[key] = self._apply_enum_mapping(value, child_path)
-            return result
-
-        elif isinstance(data, list):
-            return [
-                self._apply_enum_mapping(item, f"{path}[{i}]")
-                for i, item in enumerate(data)
-            ]
+        # Deletion works in place, on a copy of the payload's containers
+        data = _copy_containers(data)
 
-        elif schema_node:
-            enum_map = schema_node.get('x-migration-enum-map')
-            if enum_map and data in enum_map:
-                return enum_map[data]
+        # Consecutive ignores of the same kind are applied in one pass. The
+        # kinds keep their relative order, since JSONPath filters may test
+        # fields that recursive descent ignores delete
+        for recursive, paths in groupby(self.global_rules.global_ignores, _is_recursive_ignore):
+            if recursive:
+                self._delete_fields_recursive(data, _recursive_ignore_fields(paths))
+            else:
+                data = JSONPathMatcher.delete_paths(data, list(paths))
 
         return data
 
-    def _apply_array_sorting(self, data: Any, path: str) -> Any:
-        """Sort arrays by order-by specification."""
-        schema_node = self.traverser.get_schema_for_path(path)
-
-        if isinstance(data, list):
-            order_by = None
-            if schema_node:
-                order_by = schema_node.get('x-migration-order-by')
-
-            if order_by:
-                data = self._sort_array(data, order_by)
-
-            # Recurse into array items
-            return [
-                self._apply_array_sorting(item, f"{path}[{i}]")
-                for i, item in enumerate(data)
-            ]
-
-        elif isinstance(data, dict):
-            return {
-                k: self._apply_array_sorting(v, f"{path}.{k}")
-                for k, v in data.items()
-            }
+    def _delete_fields_recursive(self, data: Any, fields: frozenset[str]) -> Any:
+        """Delete the given fields from all nested objects, in place."""
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for field in node.keys() & fields:
+                    del node[field]
+                values = node.values()
+            elif isinstance(node, list):
+                values = node
+            else:
+                continue
+            stack.extend(value for value in values if isinstance(value, (dict, list)))
 
         return data
 
+    def _aliases_for(self, parent_schema: dict) -> dict:
+        """Map each alias declared by a node's properties to the property name."""
+        entry = self._aliases_cache.get(id(parent_schema))
+        if entry is not None:
+            return entry[1]
+
+        aliases = {}
+        for prop_name, prop_schema in parent_schema.get('properties', {}).items():
+            alias = prop_schema.get('x-migration-alias')
+            try:
+                # The first property declaring an alias wins
+                aliases.setdefault(alias, prop_name)
+            except TypeError:
+                pass  # unhashable, so it can never equal a key
+
+        self._aliases_cache[id(parent_schema)] = (parent_schema, aliases)
+        return aliases
+
+    def _defaults_for(self, schema_node: dict) -> list[tuple[str, Any]]:
+        """List the (property name, default) pairs a node's properties declare."""
+        entry = self._defaults_cache.get(id(schema_node))
+        if entry is not None:
+            return entry[1]
+
+        defaults = [
+            (prop_name, prop_schema['x-migration-default'])
+            for prop_name, prop_schema in schema_node.get('properties', {}).items()
+            if 'x-migration-default' in prop_schema
+        ]
+        self._defaults_cache[id(schema_node)] = (schema_node, defaults)
+        return defaults
+
     def _sort_array(self, array: list, order_by: list[str]) -> list:
         """Sort an array by the specified fields."""
         if not array or not all(isinstance(item, dict) for item in array):
             return array
 
-        def sort_key(item):
-            keys = []
-            for field in order_by:
-                descending = field.startswith('-')
-                field_name = field[1:] if descending else field
-                value = item.get(field_name)
+        try:
+            return sorted(array, key=_compile_sort_key(tuple(order_by)))
+        except TypeError:
+            # If comparison fails, return unsorted
+            return array
 
-                # Handle None values
-                if value is None:
-                    value = "" if isinstance(item.get(field_name), str) else 0
 
-                # Negate for descending order (works for numbers)
-                if descending and isinstance(value, (int, float)):
-                    value = -value
-                elif descending and isinstance(value, str):
-                    # For strings, we'll need to reverse sort separately
-                    pass
+@lru_cache(maxsize=256)
+def _compile_sort_key(order_by: tuple[str, ...]) -> Callable[[dict], Any]:
+    """
+    Build the sort key function for an x-migration-order-by specification.
 
-                keys.append((0 if not descending else 1, value))
+    Missing and null values sort as 0. A "-field" negates numbers; other
+    values keep ascending order.
 
-            return keys
+    Args:
+        order_by: Field names, each optionally prefixed with "-"
 
-        try:
-            return sorted(array, key=sort_key)
-        except TypeError:
-            # If comparison fails, return unsorted
-            return array
+    Returns:
+        Function mapping an array item to its sort key
+    """
+    fields = tuple(
+        (field[1:], True) if field.startswith('-') else (field, False)
+        for field in order_by
+    )
+    names = tuple(name for name, _ in fields)
+
+    if not any(descending for _, descending in fields):
+        if len(names) == 1:
+            name = names[0]
+
+            def sort_key(item: dict) -> Any:
+                value = item.get(name)
+                return 0 if value is None else value
+        else:
+            def sort_key(item: dict) -> Any:
+                return tuple([0 if value is None else value for value in map(item.get, names)])
+        return sort_key
+
+    def sort_key(item: dict) -> Any:
+        keys = []
+        for name, descending in fields:
+            value = item.get(name)
+            if value is None:
+                value = 0
+            elif descending and isinstance(value, (int, float)):
+                value = -value
+            keys.append(value)
+        return tuple(keys)
+    return sort_key
 
 
 class KeyedArrayTransformer:
@@ -354,10 +488,13 @@ class KeyedArrayTransformer:
     ) -> tuple[dict, list]:
         """Build a map from key values to array items."""
         result = {}
+        # Index of the item each key was first seen at (for duplicate errors)
+        first_indices = {}
         duplicates = []
 
+        get_key = _key_getter(key_spec)
         for i, item in enumerate(array):
-            key_value = extract_key_value(item, key_spec)
+            key_value = get_key(item)
 
             if key_value is None:
                 continue
@@ -366,21 +503,46 @@ class KeyedArrayTransformer:
                 if dup_handling == DuplicateHandling.ERROR:
                     duplicates.append({
                         'key': key_value,
-                        'indices': [result[key_value]['_index'], i]
+                        'indices': [first_indices[key_value], i]
                     })
                 elif dup_handling == DuplicateHandling.FIRST:
                     continue  # Keep first occurrence
                 elif dup_handling == DuplicateHandling.LAST:
-                    result[key_value] = {**item, '_index': i}
+                    result[key_value] = item
                 elif dup_handling == DuplicateHandling.MERGE:
                     result[key_value] = merge_dicts(result[key_value], item)
-                    result[key_value]['_index'] = i
             else:
-                result[key_value] = {**item, '_index': i}
-
-        # Remove _index markers
-        for key in result:
-            if '_index' in result[key]:
-                del result[key]['_index']
+                result[key_value] = item
+                first_indices[key_value] = i
 
         return result, duplicates
+
+
+def _key_getter(key_spec: str | list[str]) -> Callable[[Any], Optional[tuple]]:
+    """
+    Build a function extracting an item's key tuple, like extract_key_value.
+
+    Plain dicts are read with a single itemgetter call for all key fields.
+
+    Args:
+        key_spec: Single key name or list of key names for composite key
+
+    Returns:
+        Function mapping an item to its key tuple, or None if a key is missing
+    """
+    keys = [key_spec] if isinstance(key_spec, str) else list(key_spec)
+    if not keys:
+        return lambda item: extract_key_value(item, key_spec)
+
+    getter = itemgetter(*keys)
+    single = len(keys) == 1
+
+    def get_key(item: Any) -> Optional[tuple]:
+        if type(item) is not dict:
+            return extract_key_value(item, key_spec)
+        try:
+            value = getter(item)
+        except KeyError:
+            return None
+        return (value,) if single else value
+    return get_key
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 from enum import Enum
 
+from .models import _SLOTS
+
 
 class ParentValidationStatus(Enum):
     VALID = "VALID"
@@ -14,7 +16,7 @@ class ParentValidationStatus(Enum):
     CONSISTENT = "CONSISTENT"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParentConfig:
     """Configuration for parent relationship validation."""
     candidates_path: str = "candidates"
@@ -39,7 +41,7 @@ class ParentConfig:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParentRelationship:
     """Represents a parent-child relationship."""
     child_identity: tuple
@@ -57,7 +59,7 @@ class ParentRelationship:
         return f"{child_str} -> ROOT"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParentValidationResult:
     """Result of parent relationship validation."""
     status: ParentValidationStatus
@@ -76,7 +78,7 @@ class ParentValidationResult:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParentValidationReport:
     """Complete parent validation report."""
     results: list[ParentValidationResult] = field(default_factory=list)
@@ -109,6 +111,13 @@ class ParentValidator:
     def __init__(self, config: ParentConfig):
         self.config = config
 
+        # Dotted paths split once: the candidates path and each identity key
+        key_spec = config.identity_key
+        if isinstance(key_spec, str):
+            key_spec = [key_spec]
+        self._candidates_parts = tuple(config.candidates_path.split('.'))
+        self._identity_parts = tuple(tuple(key.split('.')) for key in key_spec)
+
     def validate(self, before: dict, after: dict) -> ParentValidationReport:
         """
         Validate parent relationships between before and after payloads.
@@ -126,27 +135,23 @@ class ParentValidator:
         if before_candidates is None or after_candidates is None:
             return report
 
-        # Build lookup maps
-        before_id_map = self._build_id_map(before_candidates)
-        after_id_map = self._build_id_map(after_candidates)
-        before_identity_map = self._build_identity_map(before_candidates)
-        after_identity_map = self._build_identity_map(after_candidates)
-
         # Build relationship maps
-        before_relationships = self._build_relationships(
-            before_candidates, before_id_map
-        )
-        after_relationships = self._build_relationships(
-            after_candidates, after_id_map
+        before_relationships = self._build_relationships(before_candidates)
+        after_relationships = self._build_relationships(after_candidates)
+
+        # Validate each entity that has a parent: those in before (with their
+        # after relationship, if any), then those only in after
+        pairs = [
+            (identity, before_rel, after_relationships.get(identity))
+            for identity, before_rel in before_relationships.items()
+        ]
+        pairs.extend(
+            (identity, None, after_rel)
+            for identity, after_rel in after_relationships.items()
+            if identity not in before_relationships
         )
 
-        # Validate each entity that has a parent
-        all_identities = set(before_relationships.keys()) | set(after_relationships.keys())
-
-        for identity in all_identities:
-            before_rel = before_relationships.get(identity)
-            after_rel = after_relationships.get(identity)
-
+        for identity, before_rel, after_rel in pairs:
             result = self._validate_relationship(
                 identity, before_rel, after_rel
             )
@@ -164,35 +169,25 @@ class ParentValidator:
 
     def _get_candidates(self, data: dict) -> Optional[list]:
         """Extract candidates array from data using configured path."""
-        path_parts = self.config.candidates_path.split('.')
-        current = data
-
-        for part in path_parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-
+        current = self._get_nested_value(data, self._candidates_parts)
         return current if isinstance(current, list) else None
 
     def _get_identity_key(self, item: dict) -> Optional[tuple]:
         """Extract identity key value(s) from an item."""
-        key_spec = self.config.identity_key
-        if isinstance(key_spec, str):
-            key_spec = [key_spec]
-
         values = []
-        for key in key_spec:
-            value = self._get_nested_value(item, key)
+        for parts in self._identity_parts:
+            if len(parts) == 1:
+                value = item.get(parts[0]) if isinstance(item, dict) else None
+            else:
+                value = self._get_nested_value(item, parts)
             if value is None:
                 return None
             values.append(value)
 
         return tuple(values)
 
-    def _get_nested_value(self, obj: dict, path: str) -> Any:
-        """Get a nested value using dot notation."""
-        parts = path.split('.')
+    def _get_nested_value(self, obj: dict, parts: tuple[str, ...]) -> Any:
+        """Get a nested value by the segments of a dotted path."""
         current = obj
 
         for part in parts:
@@ -203,58 +198,42 @@ class ParentValidator:
 
         return current
 
-    def _build_id_map(self, candidates: list) -> dict[str, dict]:
-        """Build map from internalId to candidate item."""
-        id_map = {}
-        for item in candidates:
-            item_id = item.get(self.config.id_field)
-            if item_id:
-                id_map[item_id] = item
-        return id_map
-
-    def _build_identity_map(self, candidates: list) -> dict[tuple, dict]:
-        """Build map from identity key to candidate item."""
-        identity_map = {}
-        for item in candidates:
-            identity = self._get_identity_key(item)
-            if identity:
-                identity_map[identity] = item
-        return identity_map
-
-    def _build_relationships(
-        self,
-        candidates: list,
-        id_map: dict[str, dict]
-    ) -> dict[tuple, ParentRelationship]:
+    def _build_relationships(self, candidates: list) -> dict[tuple, ParentRelationship]:
         """Build map of identity -> ParentRelationship."""
-        relationships = {}
+        id_field = self.config.id_field
+        parent_field = self.config.parent_field
 
+        # One pass indexes each item's identity by its id and collects the
+        # items that have a parent; parents can appear after their children
+        identity_by_id = {}
+        children = []
         for item in candidates:
             identity = self._get_identity_key(item)
+
+            child_id = item.get(id_field)
+            if child_id:
+                identity_by_id[child_id] = identity
+
             if not identity:
                 continue
 
-            child_id = item.get(self.config.id_field)
-            parent_id = item.get(self.config.parent_field)
-
+            parent_id = item.get(parent_field)
             if parent_id is None:
                 # Root item, no parent relationship to track
                 continue
 
-            # Resolve parent identity
-            parent_identity = None
-            if parent_id in id_map:
-                parent_item = id_map[parent_id]
-                parent_identity = self._get_identity_key(parent_item)
+            children.append((identity, child_id, parent_id))
 
-            relationships[identity] = ParentRelationship(
+        # Resolve parent identities (None for an unknown parent)
+        return {
+            identity: ParentRelationship(
                 child_identity=identity,
                 child_id=child_id,
                 parent_id=parent_id,
-                parent_identity=parent_identity
+                parent_identity=identity_by_id.get(parent_id)
             )
-
-        return relationships
+            for identity, child_id, parent_id in children
+        }
 
     def _validate_relationship(
         self,
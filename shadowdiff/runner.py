@@ -2,14 +2,50 @@
 
 from __future__ import annotations
 
+import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from .test_runner import TestRunner, GlobalReport, run_tests as _run_tests
 from .models import EngineConfig
 
 
+@lru_cache(maxsize=16)
+def _parse_schema_file(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML or JSON schema file.
+
+    Args:
+        path: Resolved path of the schema file
+        mtime_ns: Modification time, part of the cache key
+        size: File size, part of the cache key
+
+    Returns:
+        The parsed schema
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+
+    if path.endswith('.json'):
+        try:
+            return json.loads(content)
+        except ValueError:
+            pass  # not strict JSON; YAML may still accept it
+
+    # YAML also handles JSON since JSON is valid YAML
+    try:
+        return yaml.load(content, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Failed to parse schema file: {e}")
+
+
 class ShadowDiffRunner:
     """
     Test runner that loads schema from YAML file and runs tests from a folder.
@@ -54,21 +90,20 @@ class ShadowDiffRunner:
         if not self.schema_path.exists():
             raise FileNotFoundError(f"Schema file not found: {self.schema_path}")
 
-        with open(self.schema_path, 'r') as f:
-            content = f.read()
-
-        # Try YAML first (also handles JSON since JSON is valid YAML)
-        try:
-            return yaml.safe_load(content)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse schema file: {e}")
+        # Parsed schemas are shared while the file is unchanged
+        stat = self.schema_path.stat()
+        return _parse_schema_file(
+            str(self.schema_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
 
-    def run(self, print_report: bool = True) -> GlobalReport:
+    def run(self, print_report: bool = True, workers: Optional[int] = 1) -> GlobalReport:
         """
         Run all tests in the test folder.
 
         Args:
             print_report: Whether to print the summary report
+            workers: Number of worker processes (1 runs in this process,
+                None starts one per CPU)
 
         Returns:
             GlobalReport with all results
@@ -80,7 +115,8 @@ class ShadowDiffRunner:
             test_dir=str(self.test_folder),
             schema=self.schema,
             engine_config=self.engine_config,
-            print_report=print_report
+            print_report=print_report,
+            workers=workers
         )
 
     @classmethod
@@ -89,7 +125,8 @@ class ShadowDiffRunner:
         schema_path: str,
         test_folder: str,
         print_report: bool = True,
-        engine_config: Optional[EngineConfig] = None
+        engine_config: Optional[EngineConfig] = None,
+        workers: Optional[int] = 1
     ) -> GlobalReport:
         """
         Convenience class method to run tests in one call.
@@ -99,6 +136,8 @@ class ShadowDiffRunner:
             test_folder: Path to folder containing dataset JSON files
             print_report: Whether to print the summary report
             engine_config: Optional engine configuration
+            workers: Number of worker processes (1 runs in this process,
+                None starts one per CPU)
 
         Returns:
             GlobalReport with all results
@@ -107,13 +146,14 @@ class ShadowDiffRunner:
             report = ShadowDiffRunner.run_tests("schema.yaml", "tests/")
         """
         runner = cls(schema_path, test_folder, engine_config)
-        return runner.run(print_report=print_report)
+        return runner.run(print_report=print_report, workers=workers)
 
 
 def run_tests(
     schema_path: str,
     test_folder: str,
-    print_report: bool = True
+    print_report: bool = True,
+    workers: Optional[int] = 1
 ) -> GlobalReport:
     """
     Run tests from schema file and test folder.
@@ -127,8 +167,12 @@ def run_tests(
         schema_path: Path to YAML/JSON schema file with x-migration-* extensions
         test_folder: Path to folder containing dataset JSON files
         print_report: Whether to print the summary report
+        workers: Number of worker processes (1 runs in this process,
+            None starts one per CPU)
 
     Returns:
         GlobalReport with all results
     """
-    return ShadowDiffRunner.run_tests(schema_path, test_folder, print_report)
+    return ShadowDiffRunner.run_tests(
+        schema_path, test_folder, print_report, workers=workers
+    )
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
-from copy import deepcopy
+import copy
+import re
+from typing import Any, Callable, Optional
 
 from .models import (
     FieldRules,
@@ -14,6 +15,103 @@ from .models import (
     CastType,
 )
 from .exceptions import ExternalRefError, CircularRefError, SchemaParseError
+from .utils import parse_duration
+
+
+# Shared rules for paths with no schema node
+_DEFAULT_RULES = FieldRules.canonical(FieldRules())
+
+# Enum members by value, for the x-migration-* options that name one
+_STRATEGIES: dict[str, MigrationStrategy] = {m.value: m for m in MigrationStrategy}
+_CAST_TYPES: dict[str, CastType] = {m.value: m for m in CastType}
+_ARRAY_MODES: dict[str, ArrayMode] = {m.value: m for m in ArrayMode}
+_DUPLICATE_HANDLINGS: dict[str, DuplicateHandling] = {m.value: m for m in DuplicateHandling}
+
+
+def _set_strategy(rules: FieldRules, value: Any) -> None:
+    """x-migration-strategy: unknown strategies keep strict."""
+    if isinstance(value, str) and value in _STRATEGIES:
+        rules.strategy = _STRATEGIES[value]
+
+
+def _set_precision(rules: FieldRules, value: Any) -> None:
+    """x-migration-precision."""
+    if value is not None:
+        rules.precision = float(value)
+
+
+def _set_cast(rules: FieldRules, value: Any) -> None:
+    """x-migration-cast: unknown types mean no cast."""
+    if isinstance(value, str) and value in _CAST_TYPES:
+        rules.cast = _CAST_TYPES[value]
+
+
+def _set_datetime_tolerance(rules: FieldRules, value: Any) -> None:
+    """x-migration-datetime-tolerance, also parsed to seconds."""
+    rules.datetime_tolerance = value
+    if value:
+        try:
+            rules.datetime_tolerance_seconds = parse_duration(value).total_seconds()
+        except ValueError:
+            # Reported as "Invalid tolerance format" when compared
+            pass
+
+
+def _set_default(rules: FieldRules, value: Any) -> None:
+    """x-migration-default (null is a valid default)."""
+    rules.default = value
+    rules.has_default = True
+
+
+def _set_array_mode(rules: FieldRules, value: Any) -> None:
+    """x-migration-array-mode: unknown modes keep strict."""
+    if isinstance(value, str) and value in _ARRAY_MODES:
+        rules.array_mode = _ARRAY_MODES[value]
+
+
+def _set_duplicate_handling(rules: FieldRules, value: Any) -> None:
+    """x-migration-duplicate-handling: unknown values keep error."""
+    if isinstance(value, str) and value in _DUPLICATE_HANDLINGS:
+        rules.duplicate_handling = _DUPLICATE_HANDLINGS[value]
+
+
+# x-migration-* keys copied to a FieldRules attribute as they are
+_RULE_ATTRS: dict[str, str] = {
+    'x-migration-alias': 'alias',
+    'x-migration-case-insensitive': 'case_insensitive',
+    'x-migration-trim-whitespace': 'trim_whitespace',
+    'x-migration-pattern': 'pattern',
+    'x-migration-datetime-format': 'datetime_format',
+    'x-migration-enum-map': 'enum_map',
+    'x-migration-array-key': 'array_key',
+    'x-migration-order-by': 'order_by',
+    'x-migration-ignore-extra-items': 'ignore_extra_items',
+    'x-migration-ignore-missing-items': 'ignore_missing_items',
+    'x-migration-array-subset': 'array_subset',
+    'x-migration-inherit-rules': 'inherit_rules',
+    'x-migration-when': 'when_condition',
+}
+
+# x-migration-* keys whose values are validated or converted
+_RULE_SETTERS: dict[str, Callable[[FieldRules, Any], None]] = {
+    'x-migration-strategy': _set_strategy,
+    'x-migration-precision': _set_precision,
+    'x-migration-cast': _set_cast,
+    'x-migration-datetime-tolerance': _set_datetime_tolerance,
+    'x-migration-default': _set_default,
+    'x-migration-array-mode': _set_array_mode,
+    'x-migration-duplicate-handling': _set_duplicate_handling,
+}
+
+_RULE_KEYS = frozenset(_RULE_ATTRS) | frozenset(_RULE_SETTERS)
+
+# Path segments: .name, [index], ['name'] or ["name"]; and a leading name
+# without a dot
+_SEGMENT_RE = re.compile(r"\.([^.\[\]]+)|\[(\d+)\]|\['([^']+)'\]|\[\"([^\"]+)\"\]")
+_INITIAL_SEGMENT_RE = re.compile(r'^([^.\[\]]+)')
+
+# Schema leaf types _resolve_node returns as-is
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 class SchemaResolver:
@@ -23,21 +121,42 @@ class SchemaResolver:
         self.schema = schema
         self.max_depth = max_depth
         self._resolution_stack: list[str] = []
+        # Resolved $ref targets, with how far below the $ref they reach. Only
+        # targets resolved without hitting max_depth are kept: they resolve
+        # the same wherever they fit
+        self._ref_cache: dict[str, tuple[Any, int]] = {}
+        # Unescaped JSON pointer segments per $ref string
+        self._ref_segments_cache: dict[str, list[str]] = {}
+        # Deepest depth the current walk has reached
+        self._deepest = 0
 
     def resolve(self) -> dict:
         """
         Resolve all $ref references in the schema.
 
         Returns:
-            Fully resolved schema with all $refs inlined
+            Fully resolved schema with all $refs inlined (a target referenced
+            more than once may be shared)
         """
+        self._ref_cache.clear()
+        self._deepest = 0
         return self._resolve_node(self.schema, depth=0)
 
     def _resolve_node(self, node: Any, depth: int) -> Any:
         """Recursively resolve a schema node."""
+        if depth > self._deepest:
+            self._deepest = depth
+
+        # max_depth also bounds the recursion: one frame per level, plus one
+        # per $ref on the way down
         if depth > self.max_depth:
             return node
 
+        # Most nodes are leaves; an exact type check skips both isinstance
+        # calls, which stay for dict/list subclasses (e.g. from YAML loaders)
+        if type(node) in _SCALAR_TYPES:
+            return node
+
         if isinstance(node, dict):
             if '$ref' in node:
                 return self._resolve_ref(node['$ref'], depth)
@@ -65,16 +184,19 @@ class SchemaResolver:
         if ref in self._resolution_stack:
             raise CircularRefError(ref)
 
+        cached = self._ref_cache.get(ref)
+        if cached is not None:
+            resolved, height = cached
+            if depth + height <= self.max_depth:
+                self._deepest = max(self._deepest, depth + height)
+                return resolved
+
         self._resolution_stack.append(ref)
 
         try:
-            # Parse the reference path
-            path_parts = ref[2:].split('/')  # Remove '#/' prefix
             resolved = self.schema
 
-            for part in path_parts:
-                # Handle JSON pointer escaping
-                part = part.replace('~1', '/').replace('~0', '~')
+            for part in self._ref_segments(ref):
                 if isinstance(resolved, dict) and part in resolved:
                     resolved = resolved[part]
                 else:
@@ -83,12 +205,33 @@ class SchemaResolver:
                         reason=f"Path component '{part}' not found"
                     )
 
-            # Recursively resolve the referenced schema
-            return self._resolve_node(deepcopy(resolved), depth + 1)
+            # Recursively resolve the referenced schema; the walk builds new
+            # containers, so the target needs no copy
+            outer_deepest = self._deepest
+            self._deepest = depth
+            result = self._resolve_node(resolved, depth + 1)
+
+            deepest = self._deepest
+            if deepest <= self.max_depth:
+                self._ref_cache[ref] = (result, deepest - depth)
+            self._deepest = max(outer_deepest, deepest)
+            return result
 
         finally:
             self._resolution_stack.pop()
 
+    def _ref_segments(self, ref: str) -> list[str]:
+        """Split a local $ref into unescaped JSON pointer segments (cached per ref)."""
+        segments = self._ref_segments_cache.get(ref)
+        if segments is None:
+            # Remove '#/' prefix and handle JSON pointer escaping
+            segments = [
+                part.replace('~1', '/').replace('~0', '~') if '~' in part else part
+                for part in ref[2:].split('/')
+            ]
+            self._ref_segments_cache[ref] = segments
+        return segments
+
 
 class RuleExtractor:
     """Extracts migration rules from schema properties."""
@@ -108,84 +251,35 @@ class RuleExtractor:
         Returns:
             FieldRules object with all extracted rules
         """
+        inherit = parent_rules and parent_rules.inherit_rules
+        if not inherit and _RULE_KEYS.isdisjoint(schema_node):
+            # No rules of its own and nothing inherited: the shared defaults
+            return _DEFAULT_RULES
+
         rules = FieldRules()
 
-        # Check for rule inheritance
-        if parent_rules and parent_rules.inherit_rules:
+        # Check for rule inheritance. An absent x-migration-strategy means
+        # strict, so the parent's strategy only outlives an invalid one
+        if inherit:
             rules = FieldRules(
-                strategy=parent_rules.strategy,
                 case_insensitive=parent_rules.case_insensitive,
                 trim_whitespace=parent_rules.trim_whitespace,
-                inherit_rules=True,
             )
+            if 'x-migration-strategy' in schema_node:
+                rules.strategy = parent_rules.strategy
+
+        # One pass over the node's keys; most nodes have few x-migration-*
+        # keys, if any
+        for key, value in schema_node.items():
+            attr = _RULE_ATTRS.get(key)
+            if attr is not None:
+                setattr(rules, attr, value)
+            else:
+                setter = _RULE_SETTERS.get(key)
+                if setter is not None:
+                    setter(rules, value)
 
-        # x-migration-strategy
-        strategy = schema_node.get('x-migration-strategy', 'strict')
-        if strategy in [s.value for s in MigrationStrategy]:
-            rules.strategy = MigrationStrategy(strategy)
-
-        # x-migration-alias
-        rules.alias = schema_node.get('x-migration-alias')
-
-        # x-migration-precision
-        precision = schema_node.get('x-migration-precision')
-        if precision is not None:
-            rules.precision = float(precision)
-
-        # x-migration-case-insensitive
-        rules.case_insensitive = schema_node.get(
-            'x-migration-case-insensitive',
-            rules.case_insensitive
-        )
-
-        # x-migration-trim-whitespace
-        rules.trim_whitespace = schema_node.get(
-            'x-migration-trim-whitespace',
-            rules.trim_whitespace
-        )
-
-        # x-migration-cast
-        cast = schema_node.get('x-migration-cast')
-        if cast and cast in [c.value for c in CastType]:
-            rules.cast = CastType(cast)
-
-        # x-migration-pattern
-        rules.pattern = schema_node.get('x-migration-pattern')
-
-        # x-migration-datetime-format
-        rules.datetime_format = schema_node.get('x-migration-datetime-format')
-
-        # x-migration-datetime-tolerance
-        rules.datetime_tolerance = schema_node.get('x-migration-datetime-tolerance')
-
-        # x-migration-default
-        if 'x-migration-default' in schema_node:
-            rules.default = schema_node['x-migration-default']
-            rules.has_default = True
-
-        # x-migration-enum-map
-        rules.enum_map = schema_node.get('x-migration-enum-map')
-
-        # Array rules
-        array_mode = schema_node.get('x-migration-array-mode', 'strict')
-        if array_mode in [m.value for m in ArrayMode]:
-            rules.array_mode = ArrayMode(array_mode)
-
-        rules.array_key = schema_node.get('x-migration-array-key')
-        rules.order_by = schema_node.get('x-migration-order-by')
-        rules.ignore_extra_items = schema_node.get('x-migration-ignore-extra-items', False)
-        rules.ignore_missing_items = schema_node.get('x-migration-ignore-missing-items', False)
-        rules.array_subset = schema_node.get('x-migration-array-subset', False)
-
-        dup_handling = schema_node.get('x-migration-duplicate-handling', 'error')
-        if dup_handling in [d.value for d in DuplicateHandling]:
-            rules.duplicate_handling = DuplicateHandling(dup_handling)
-
-        # Global/inherited rules
-        rules.inherit_rules = schema_node.get('x-migration-inherit-rules', False)
-        rules.when_condition = schema_node.get('x-migration-when')
-
-        return rules
+        return FieldRules.canonical(rules)
 
     @staticmethod
     def extract_global_rules(schema: dict) -> GlobalRules:
@@ -229,66 +323,134 @@ class SchemaTraverser:
     def __init__(self, schema: dict):
         self.schema = schema
         self.rule_extractor = RuleExtractor()
+        # Root schema object (unwrapped from components/schemas); fixed for
+        # the traverser's lifetime
+        self._root_schema = self._compute_root_schema()
         self._schema_cache: dict[str, Optional[dict]] = {}
+        # Schema node per path segments tuple, including every prefix
+        self._segment_cache: dict[tuple, Optional[dict]] = {}
+        # Rules per (id(schema node), id(parent_rules)); entries keep
+        # parent_rules so a reused id can be detected
+        self._rules_cache: dict[tuple[int, int], tuple[Optional[FieldRules], FieldRules]] = {}
+        self._child_rules_cache: dict[tuple[int, int], tuple[Optional[FieldRules], tuple]] = {}
+        self._rules_under_cache: dict[int, tuple[dict, bool]] = {}
+
+    def fork(self) -> SchemaTraverser:
+        """
+        Create a traverser over the same schema for another payload pair.
+
+        Caches keyed by schema node (rules, child rules, rules below a node)
+        are shared. Caches keyed by payload paths start empty: they grow with
+        array indices and keyed-array item values, so they live for one
+        payload pair only.
 
-    def get_schema_for_path(self, path: str) -> Optional[dict]:
+        Returns:
+            The new traverser
+        """
+        traverser = copy.copy(self)
+        traverser._schema_cache = {}
+        traverser._segment_cache = {}
+        return traverser
+
+    def get_schema_for_path(self, path: str | tuple) -> Optional[dict]:
         """
         Get the schema node for a given JSONPath.
 
         Args:
-            path: The JSONPath (e.g., '$.user.name')
+            path: The JSONPath (e.g., '$.user.name'), or its segments as a
+                tuple (see get_schema_for_segments)
 
         Returns:
             Schema node or None if not found
         """
+        if isinstance(path, tuple):
+            return self.get_schema_for_segments(path)
+
         if path in self._schema_cache:
             return self._schema_cache[path]
 
-        result = self._traverse_to_path(path)
+        # Each path string is parsed once
+        if path == '$':
+            result = self._root_schema
+        else:
+            result = self.get_schema_for_segments(tuple(self._parse_path_segments(path)))
         self._schema_cache[path] = result
         return result
 
-    def _traverse_to_path(self, path: str) -> Optional[dict]:
-        """Traverse schema to find node for path."""
-        if path == '$':
-            return self._get_root_schema()
+    def get_schema_for_segments(self, segments: tuple) -> Optional[dict]:
+        """
+        Get the schema node for a path already split into segments.
 
-        # Parse path segments
-        segments = self._parse_path_segments(path)
-        if not segments:
-            return self._get_root_schema()
+        Every prefix is memoized too, so sibling paths only resolve their
+        last segment.
 
-        current = self._get_root_schema()
-        if not current:
-            return None
+        Args:
+            segments: Property names and array indices (ints) below the root,
+                e.g. ('user', 'roles', 0)
 
-        for segment in segments:
-            if current is None:
-                return None
+        Returns:
+            Schema node or None if not found
+        """
+        cache = self._segment_cache
+        if segments in cache:
+            return cache[segments]
 
+        if not segments:
+            current = self._root_schema
+        else:
+            current = self.get_schema_for_segments(segments[:-1])
+            segment = segments[-1]
             if isinstance(segment, int):
-                # Array index - get items schema
-                if current.get('type') == 'array' and 'items' in current:
-                    current = current['items']
-                else:
-                    return None
+                current = self.get_items_schema(current)
             else:
-                # Object property
-                if current.get('type') == 'object' or 'properties' in current:
-                    props = current.get('properties', {})
-                    if segment in props:
-                        current = props[segment]
-                    elif 'additionalProperties' in current:
-                        current = current['additionalProperties']
-                    else:
-                        return None
-                else:
-                    return None
+                current = self.get_property_schema(current, segment)
 
+        cache[segments] = current
         return current
 
-    def _get_root_schema(self) -> Optional[dict]:
-        """Get the root schema object."""
+    @staticmethod
+    def get_property_schema(schema_node: Optional[dict], key: Any) -> Optional[dict]:
+        """
+        Get the schema node for a property of an object.
+
+        Args:
+            schema_node: The object's schema node
+            key: The property name
+
+        Returns:
+            The property's (or additional properties') schema node, or None
+        """
+        if not schema_node:
+            return None
+
+        if schema_node.get('type') == 'object' or 'properties' in schema_node:
+            props = schema_node.get('properties', {})
+            if key in props:
+                return props[key]
+            if 'additionalProperties' in schema_node:
+                return schema_node['additionalProperties']
+        return None
+
+    @staticmethod
+    def get_items_schema(schema_node: Optional[dict]) -> Optional[dict]:
+        """
+        Get the schema node shared by the items of an array.
+
+        Args:
+            schema_node: The array's schema node
+
+        Returns:
+            The items schema node, or None
+        """
+        if not schema_node:
+            return None
+
+        if schema_node.get('type') == 'array' and 'items' in schema_node:
+            return schema_node['items']
+        return None
+
+    def _compute_root_schema(self) -> Optional[dict]:
+        """Find the root schema object."""
         schema = self.schema
 
         # Handle wrapped schemas
@@ -305,8 +467,6 @@ class SchemaTraverser:
 
     def _parse_path_segments(self, path: str) -> list:
         """Parse JSONPath into segments."""
-        import re
-
         if path == '$':
             return []
 
@@ -317,18 +477,16 @@ class SchemaTraverser:
             path = path[1:]
 
         segments = []
-        # Match either .name or [index] or ['name']
-        pattern = r"\.([^.\[\]]+)|\[(\d+)\]|\['([^']+)'\]|\[\"([^\"]+)\"\]"
 
         pos = 0
         # Handle initial segment without dot
         if path and not path.startswith('[') and not path.startswith('.'):
-            match = re.match(r'^([^.\[\]]+)', path)
+            match = _INITIAL_SEGMENT_RE.match(path)
             if match:
                 segments.append(match.group(1))
                 pos = match.end()
 
-        for match in re.finditer(pattern, path[pos:]):
+        for match in _SEGMENT_RE.finditer(path, pos):
             if match.group(1) is not None:
                 segments.append(match.group(1))
             elif match.group(2) is not None:
@@ -356,6 +514,129 @@ class SchemaTraverser:
             FieldRules for the path
         """
         schema_node = self.get_schema_for_path(path)
-        if schema_node:
-            return self.rule_extractor.extract_field_rules(schema_node, parent_rules)
-        return FieldRules()
+        if not schema_node:
+            return _DEFAULT_RULES
+
+        # Paths sharing a schema node (e.g. every item of an array) share rules
+        key = (id(schema_node), id(parent_rules))
+        entry = self._rules_cache.get(key)
+        if entry is not None and entry[0] is parent_rules:
+            return entry[1]
+
+        rules = self.rule_extractor.extract_field_rules(schema_node, parent_rules)
+        self._rules_cache[key] = (parent_rules, rules)
+        return rules
+
+    def has_rules_under(self, path: str | tuple) -> bool:
+        """
+        Check whether any x-migration-* rule applies below a path.
+
+        Rules on the node itself are not considered; only its properties,
+        items and additional properties (at any depth) are.
+
+        Args:
+            path: The JSONPath of an object or array, as a string or tuple
+                (see get_schema_for_path)
+
+        Returns:
+            True if some descendant schema node declares a migration rule
+        """
+        return self.has_rules_below(self.get_schema_for_path(path))
+
+    def has_rules_below(self, schema_node: Optional[dict]) -> bool:
+        """
+        Check whether any x-migration-* rule applies below a schema node.
+
+        Args:
+            schema_node: Schema node of an object or array
+
+        Returns:
+            True if some descendant schema node declares a migration rule
+        """
+        if not schema_node:
+            return False
+
+        key = id(schema_node)
+        entry = self._rules_under_cache.get(key)
+        if entry is not None and entry[0] is schema_node:
+            return entry[1]
+
+        result = any(
+            _declares_migration_rules(schema_node.get(child))
+            for child in ('properties', 'items', 'additionalProperties')
+        )
+        self._rules_under_cache[key] = (schema_node, result)
+        return result
+
+    def get_child_rules(
+        self,
+        path: str,
+        parent_rules: Optional[FieldRules] = None
+    ) -> tuple[dict[str, FieldRules], FieldRules]:
+        """
+        Get the migration rules for the children of an object.
+
+        Args:
+            path: The JSONPath of the object
+            parent_rules: The object's rules, for inheritance
+
+        Returns:
+            Tuple of (rules per declared property, rules for any other key)
+        """
+        schema_node = self.get_schema_for_path(path)
+        if not schema_node or not (
+            schema_node.get('type') == 'object' or 'properties' in schema_node
+        ):
+            return {}, _DEFAULT_RULES
+
+        key = (id(schema_node), id(parent_rules))
+        entry = self._child_rules_cache.get(key)
+        if entry is not None and entry[0] is parent_rules:
+            return entry[1]
+
+        extract = self.rule_extractor.extract_field_rules
+        declared = {
+            name: extract(node, parent_rules) if node else _DEFAULT_RULES
+            for name, node in schema_node.get('properties', {}).items()
+        }
+        additional = schema_node.get('additionalProperties')
+        if isinstance(additional, dict) and additional:
+            undeclared = extract(additional, parent_rules)
+        else:
+            undeclared = _DEFAULT_RULES
+
+        result = (declared, undeclared)
+        self._child_rules_cache[key] = (parent_rules, result)
+        return result
+
+    def get_rules_for_array_item(
+        self,
+        array_path: str,
+        parent_rules: Optional[FieldRules] = None
+    ) -> FieldRules:
+        """
+        Get the migration rules shared by every item of an array.
+
+        Args:
+            array_path: The JSONPath of the array
+            parent_rules: The array's rules, for inheritance
+
+        Returns:
+            FieldRules for the array's items
+        """
+        return self.get_rules_for_path(f"{array_path}[0]", parent_rules)
+
+
+def _declares_migration_rules(node: Any) -> bool:
+    """Check whether a schema fragment contains any x-migration-* key."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for key, value in current.items():
+                if isinstance(key, str) and key.startswith('x-migration-'):
+                    return True
+                stack.append(value)
+        elif isinstance(current, list):
+            stack.extend(current)
+    return False
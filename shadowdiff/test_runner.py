@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
-import json
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from .engine import ShadowDiffEngine
-from .models import EngineConfig, DiffReport
+from .models import EngineConfig, DiffReport, _SLOTS
 from .extractor import DataExtractor, ExtractConfig, ExtractedData, DataAggregator
 from .parent_validator import ParentValidator, ParentConfig, ParentValidationReport
+from .utils import dumps_json, loads_json
 
 
-@dataclass
+# Diff types that mean array entries were removed or added
+_REMOVED_TYPES = frozenset({"ARRAY_ITEM_MISSING"})
+_ADDED_TYPES = frozenset({"ARRAY_ITEM_EXTRA", "EXTRA_IN_NEW"})
+
+
+@dataclass(**_SLOTS)
 class ScenarioResult:
     """Result of a single test scenario."""
     name: str
@@ -39,7 +46,7 @@ class ScenarioResult:
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GlobalReport:
     """Global test report across all scenarios."""
     total: int = 0
@@ -63,6 +70,12 @@ class GlobalReport:
             }
 
     def to_dict(self) -> dict:
+        result = self._header_dict()
+        result["scenarios"] = list(self.iter_scenario_dicts())
+        return result
+
+    def _header_dict(self) -> dict:
+        """Everything in to_dict except the scenarios list."""
         pass_rate = f"{(self.passed / self.total * 100):.1f}%" if self.total > 0 else "0.0%"
         return {
             "timestamp": self.timestamp,
@@ -74,9 +87,35 @@ class GlobalReport:
             },
             "breakdown": self.breakdown,
             "aggregations": self.aggregations,
-            "scenarios": [s.to_dict() for s in self.scenarios]
         }
 
+    def iter_scenario_dicts(self) -> Iterator[dict]:
+        """Yield each scenario's to_dict, one at a time."""
+        for scenario in self.scenarios:
+            yield scenario.to_dict()
+
+    def write_json(self, fp) -> None:
+        """
+        Write the report (as described by to_dict) to a binary file, 2-space indented.
+
+        Scenarios are serialized one at a time so the full report dict never
+        has to exist in memory. Values are serialized as json.dumps would
+        (see utils.dumps_json), whether or not orjson is installed.
+
+        Args:
+            fp: File object opened in binary mode
+        """
+        header = dumps_json(self._header_dict(), indent=True)
+        # Reopen the header object so the scenarios list can be appended last
+        fp.write(header[:header.rindex(b"\n}")])
+        fp.write(b',\n  "scenarios": [')
+        separator = b"\n"
+        for scenario in self.iter_scenario_dicts():
+            fp.write(separator)
+            fp.write(b"\n".join(b"    " + line for line in dumps_json(scenario, indent=True).split(b"\n")))
+            separator = b",\n"
+        fp.write(b"\n  ]\n}" if separator == b",\n" else b"]\n}")
+
     def print_summary(self):
         pass_rate = f"{(self.passed / self.total * 100):.1f}%" if self.total > 0 else "0.0%"
         print(f"\nTest Results: {self.passed}/{self.total} passed ({pass_rate})")
@@ -106,9 +145,22 @@ class GlobalReport:
 class TestRunner:
     """Runs test datasets against a schema."""
 
-    def __init__(self, schema: dict, engine_config: Optional[EngineConfig] = None):
+    def __init__(
+        self,
+        schema: dict,
+        engine_config: Optional[EngineConfig] = None,
+        report_details: bool = True
+    ):
+        """
+        Args:
+            schema: Schema with x-migration-* extensions
+            engine_config: Engine configuration
+            report_details: Keep the diff report and parent validation of
+                passing scenarios; when False only failing scenarios carry them
+        """
         self.schema = schema
         self.engine = ShadowDiffEngine(engine_config or EngineConfig())
+        self.report_details = report_details
 
         # Setup extraction if configured
         self.extract_config = ExtractConfig.from_schema(schema)
@@ -158,10 +210,16 @@ class TestRunner:
 
         for diff in diffs:
             diff_type = diff.get("type", "")
-            if diff_type == "ARRAY_ITEM_MISSING":
+            if diff_type in _REMOVED_TYPES:
                 entries_removed = True
-            elif diff_type in ("ARRAY_ITEM_EXTRA", "EXTRA_IN_NEW"):
+            elif diff_type in _ADDED_TYPES:
                 entries_added = True
+            else:
+                continue
+
+            # Nothing left to find
+            if entries_removed and entries_added:
+                break
 
         return {
             "has_changes": has_changes,
@@ -177,6 +235,7 @@ class TestRunner:
         extracted_data = None
         parent_validation = None
         diff_report_dict = None
+        passed = False
 
         try:
             # Run comparison
@@ -189,80 +248,103 @@ class TestRunner:
                 if self.aggregator:
                     self.aggregator.add_dataset(name, extracted)
 
+            is_report = hasattr(result, 'is_match')
+            # Passing scenarios only need details when the caller keeps them
+            details = self.report_details or not (is_report and result.is_match)
+
             # Validate parent relationships if configured
-            if self.parent_validator:
+            if self.parent_validator and details:
                 parent_result = self.parent_validator.validate(before, after)
                 parent_validation = parent_result.to_dict()
 
-            if hasattr(result, 'is_match'):
-                diff_report_dict = self._diff_report_to_dict(result)
+            if is_report:
+                if details:
+                    diff_report_dict = self._diff_report_to_dict(result)
                 passed = result.is_match
-                return ScenarioResult(
-                    name=name,
-                    dataset_path=dataset_path,
-                    passed=passed,
-                    diff_report=diff_report_dict,
-                    parent_validation=parent_validation,
-                    extracted_data=extracted_data
-                )
             else:
-                return ScenarioResult(
-                    name=name,
-                    dataset_path=dataset_path,
-                    passed=False,
-                    diff_report={"error": str(result.error)},
-                    parent_validation=parent_validation,
-                    extracted_data=extracted_data
-                )
+                diff_report_dict = {"error": str(result.error)}
         except Exception as e:
-            return ScenarioResult(
-                name=name,
-                dataset_path=dataset_path,
-                passed=False,
-                diff_report={"error": str(e)},
-                parent_validation=parent_validation,
-                extracted_data=extracted_data
-            )
-
-    def run_folder(self, folder: str, print_report: bool = True) -> GlobalReport:
-        """Run all dataset files in a folder."""
+            diff_report_dict = {"error": str(e)}
+
+        return ScenarioResult(
+            name=name,
+            dataset_path=dataset_path,
+            passed=passed,
+            diff_report=diff_report_dict,
+            parent_validation=parent_validation,
+            extracted_data=extracted_data
+        )
+
+    def run_folder(
+        self,
+        folder: str,
+        print_report: bool = True,
+        workers: Optional[int] = 1
+    ) -> GlobalReport:
+        """
+        Run all dataset files in a folder.
+
+        Args:
+            folder: Folder containing dataset JSON files
+            print_report: Whether to print per-scenario results and the summary
+            workers: Number of worker processes (1 runs in this process,
+                None starts one per CPU)
+
+        Returns:
+            GlobalReport with all results
+        """
         report = GlobalReport()
         folder_path = Path(folder)
+        dataset_files = sorted(folder_path.glob("*.json"))
 
-        for dataset_file in sorted(folder_path.glob("*.json")):
-            with open(dataset_file) as f:
-                dataset = json.load(f)
-
-            name = dataset.get("name", dataset_file.stem)
-            dataset_path = str(dataset_file)
-            result = self.run_dataset(dataset, name, dataset_path)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        # A few files finish sooner than worker processes start up
+        workers = min(workers, len(dataset_files))
+        if workers > 1 and len(dataset_files) >= _MIN_PARALLEL_FILES:
+            results = self._run_files_parallel(dataset_files, workers)
+        else:
+            results = (self._run_file(dataset_file) for dataset_file in dataset_files)
 
-            report.scenarios.append(result)
-            report.total += 1
+        # PASS/FAIL lines not written out yet; written and flushed once per
+        # completed file (live progress), and in any case before returning
+        log_lines: list[str] = []
 
-            if result.passed:
-                report.passed += 1
-                report.breakdown["no_changes"].append(name)
-                if print_report:
-                    print(f"PASS: {name}")
-            else:
-                report.failed += 1
-                report.breakdown["with_changes"].append(name)
-                if print_report:
-                    print(f"FAIL: {name}")
-
-                # Analyze diffs for breakdown
-                if result.diff_report and "diffs" in result.diff_report:
-                    analysis = self._analyze_diffs(result.diff_report["diffs"])
-                    if analysis["entries_removed"]:
-                        report.breakdown["entries_removed"].append(name)
-                    if analysis["entries_added"]:
-                        report.breakdown["entries_added"].append(name)
-
-                # Check for orphan parents
-                if result.parent_validation:
-                    if result.parent_validation.get("summary", {}).get("orphans", 0) > 0:
-                        report.breakdown["orphan_parents"].append(name)
+        try:
+            for result in results:
+                name = result.name
+
+                report.scenarios.append(result)
+                report.total += 1
+
+                if result.passed:
+                    report.passed += 1
+                    report.breakdown["no_changes"].append(name)
+                    if print_report:
+                        log_lines.append(f"PASS: {name}\n")
+                else:
+                    report.failed += 1
+                    report.breakdown["with_changes"].append(name)
+                    if print_report:
+                        log_lines.append(f"FAIL: {name}\n")
+
+                    # Analyze diffs for breakdown
+                    if result.diff_report and "diffs" in result.diff_report:
+                        analysis = self._analyze_diffs(result.diff_report["diffs"])
+                        if analysis["entries_removed"]:
+                            report.breakdown["entries_removed"].append(name)
+                        if analysis["entries_added"]:
+                            report.breakdown["entries_added"].append(name)
+
+                    # Check for orphan parents
+                    if result.parent_validation:
+                        if result.parent_validation.get("summary", {}).get("orphans", 0) > 0:
+                            report.breakdown["orphan_parents"].append(name)
+
+                if log_lines:
+                    _write_log(log_lines)
+        finally:
+            _write_log(log_lines)
 
         # Add aggregation results
         if self.aggregator:
@@ -273,13 +355,76 @@ class TestRunner:
 
         return report
 
+    def _run_file(self, dataset_file: Path) -> ScenarioResult:
+        """Load and run a single dataset file."""
+        dataset = _load_dataset(dataset_file)
+        name = dataset.get("name", dataset_file.stem)
+        return self.run_dataset(dataset, name, str(dataset_file))
+
+    def _run_files_parallel(
+        self,
+        dataset_files: list[Path],
+        workers: int
+    ) -> Iterator[ScenarioResult]:
+        """Run dataset files in worker processes, yielding results in file order."""
+        # Imported here: multiprocessing is only needed with workers > 1
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(dataset_files) // (4 * workers))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.schema, self.engine.config, self.report_details)
+        ) as executor:
+            for result in executor.map(_run_worker_file, dataset_files, chunksize=chunksize):
+                # Workers aggregate into their own copy; merge here instead
+                if self.aggregator and result.extracted_data:
+                    self.aggregator.add_dataset(result.name, ExtractedData(
+                        input_data=result.extracted_data["input"],
+                        before_data=result.extracted_data["before"],
+                        after_data=result.extracted_data["after"]
+                    ))
+                yield result
+
+
+def _write_log(lines: list[str]) -> None:
+    """Write out (and clear) pending log lines, flushing stdout."""
+    sys.stdout.writelines(lines)
+    lines.clear()
+    sys.stdout.flush()
+
+
+def _load_dataset(dataset_file: Path) -> Any:
+    """Parse a dataset file (with orjson when it is installed and lossless)."""
+    return loads_json(dataset_file.read_bytes())
+
+
+# Fewest dataset files run_folder hands to worker processes
+_MIN_PARALLEL_FILES = 4
+
+# Per-process runner used by run_folder workers
+_worker_runner: Optional[TestRunner] = None
+
+
+def _init_worker(schema: dict, engine_config: EngineConfig, report_details: bool):
+    """Create the worker process's TestRunner once."""
+    global _worker_runner
+    _worker_runner = TestRunner(schema, engine_config, report_details)
+
+
+def _run_worker_file(dataset_file: Path) -> ScenarioResult:
+    """Run a single dataset file in a worker process."""
+    return _worker_runner._run_file(dataset_file)
+
 
 def run_tests(
     test_dir: str,
     schema: dict,
     engine_config: Optional[EngineConfig] = None,
-    print_report: bool = True
+    print_report: bool = True,
+    workers: Optional[int] = 1
 ) -> GlobalReport:
     """Run all tests in a directory."""
     runner = TestRunner(schema, engine_config)
-    return runner.run_folder(test_dir, print_report)
+    return runner.run_folder(test_dir, print_report, workers)
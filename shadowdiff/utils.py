@@ -6,13 +6,32 @@ import re
 import json
 import copy
 from datetime import timedelta
-from typing import Any, Optional
+from functools import lru_cache
+from math import isfinite
+from typing import Any, Callable, Optional
 
+try:
+    import orjson
+except ImportError:  # optional: faster payload size checks and (de)serialization
+    orjson = None
 
+
+# An integer token beyond 64 bits, which orjson would parse into a lossy
+# float; a match inside a string only costs a json parse
+_WIDE_INT_RE = re.compile(rb'(?:^|[\[:,])\s*(?:-\d{19}|\d{20})')
+
+_DURATION_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([smhd])$')
+# timedelta keyword per duration unit (the pattern only admits these)
+_DURATION_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+@lru_cache(maxsize=512)
 def parse_duration(duration_str: str) -> timedelta:
     """
     Parse a duration string like '5s', '1m', '1h', '1d' into a timedelta.
 
+    Results are cached: schemas repeat the same few tolerances.
+
     Args:
         duration_str: Duration string (e.g., '5s', '1m', '2h', '1d')
 
@@ -22,40 +41,135 @@ def parse_duration(duration_str: str) -> timedelta:
     if not duration_str:
         return timedelta(0)
 
-    pattern = r'^(\d+(?:\.\d+)?)\s*([smhd])$'
-    match = re.match(pattern, duration_str.strip().lower())
+    match = _DURATION_RE.match(duration_str.strip().lower())
 
     if not match:
         raise ValueError(f"Invalid duration format: {duration_str}")
 
-    value = float(match.group(1))
-    unit = match.group(2)
+    value, unit = match.groups()
+    return timedelta(**{_DURATION_UNITS[unit]: float(value)})
 
-    if unit == 's':
-        return timedelta(seconds=value)
-    elif unit == 'm':
-        return timedelta(minutes=value)
-    elif unit == 'h':
-        return timedelta(hours=value)
-    elif unit == 'd':
-        return timedelta(days=value)
 
-    raise ValueError(f"Unknown duration unit: {unit}")
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile and cache a regex pattern (as many as re's own cache keeps)."""
+    return re.compile(pattern)
 
 
 def deep_copy(obj: Any) -> Any:
     """Create a deep copy of an object."""
+    return _json_deepcopy(obj)
+
+
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _json_deepcopy(obj: Any) -> Any:
+    """
+    Deep copy JSON-shaped data without copy.deepcopy's memo and dispatch.
+
+    Plain dicts and lists are rebuilt and JSON scalars returned as they
+    are; anything else goes through copy.deepcopy.
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _json_deepcopy(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [_json_deepcopy(item) for item in obj]
+    if obj_type in _IMMUTABLE_TYPES:
+        return obj
     return copy.deepcopy(obj)
 
 
 def get_json_size_mb(obj: Any) -> float:
     """Get the approximate size of a JSON object in megabytes."""
-    json_str = json.dumps(obj)
-    return len(json_str.encode('utf-8')) / (1024 * 1024)
+    if orjson is not None:
+        try:
+            # Compact UTF-8 bytes, produced without an intermediate str
+            return len(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)) / (1024 * 1024)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, which json accepts
+
+    # dumps escapes non-ASCII (ensure_ascii), so the string length is
+    # already the UTF-8 byte count; no need to encode a copy
+    return len(json.dumps(obj)) / (1024 * 1024)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to JSON bytes, with the same contents json.dumps would produce.
+
+    orjson is used when it is installed, unless it rejects the value (e.g.
+    integers beyond 64 bits) or would change it (NaN and infinities, which it
+    writes as null); json serializes those.
+
+    Args:
+        obj: The value to serialize
+        indent: Indent by 2 spaces instead of writing compact JSON
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, which json accepts
+        else:
+            # Non-finite floats come out as null, so only then is a check needed
+            if b"null" not in data or not _has_non_finite(obj):
+                return data
+
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse JSON bytes into the same value json.loads would.
+
+    orjson is used when it is installed, unless the document has an integer
+    beyond 64 bits (which orjson turns into a float) or NaN/Infinity (which
+    orjson rejects); json parses those.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        The parsed value
+    """
+    if orjson is not None and not _WIDE_INT_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or Infinity, which json accepts
+
+    return json.loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check whether a JSON value contains NaN or an infinity at any depth."""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, float):
+            if not isfinite(current):
+                return True
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+    return False
 
 
 def is_numeric(value: Any) -> bool:
     """Check if a value is numeric (int or float)."""
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        return True
+    if value_type is bool:
+        return False
     return isinstance(value, (int, float)) and not isinstance(value, bool)
 
 
@@ -70,28 +184,70 @@ def safe_cast(value: Any, cast_type: str) -> Any:
     Returns:
         The casted value
     """
+    return get_cast_function(cast_type)(value)
+
+
+def get_cast_function(cast_type: str) -> Callable[[Any], Any]:
+    """
+    Get the function applying ``safe_cast`` for one cast type.
+
+    Args:
+        cast_type: Target type ('int', 'float', 'string', 'boolean')
+
+    Returns:
+        Function casting a value (unknown types leave values unchanged)
+    """
+    return _CAST_FUNCTIONS.get(cast_type, _no_cast)
+
+
+def _no_cast(value: Any) -> Any:
+    return value
+
+
+def _cast_int(value: Any) -> Any:
     if value is None:
         return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return value
+
 
+def _cast_float(value: Any) -> Any:
+    if value is None:
+        return None
     try:
-        if cast_type == 'int':
-            return int(float(value))
-        elif cast_type == 'float':
-            return float(value)
-        elif cast_type == 'string':
-            return str(value)
-        elif cast_type == 'boolean':
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                return value.lower() in ('true', '1', 'yes', 'on')
-            return bool(value)
+        return float(value)
     except (ValueError, TypeError):
         return value
 
-    return value
+
+def _cast_string(value: Any) -> Any:
+    if value is None:
+        return None
+    return str(value)
 
 
+_TRUTHY_STRINGS = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _cast_boolean(value: Any) -> Any:
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY_STRINGS
+    return bool(value)
+
+
+_CAST_FUNCTIONS: dict[str, Callable[[Any], Any]] = {
+    'int': _cast_int,
+    'float': _cast_float,
+    'string': _cast_string,
+    'boolean': _cast_boolean,
+}
+
+
+@lru_cache(maxsize=2048)
 def normalize_path(path: str) -> str:
     """Normalize a JSONPath expression."""
     if not path:
@@ -105,16 +261,38 @@ def build_path(parent_path: str, key: str | int) -> str:
     """Build a JSONPath from parent path and key."""
     if isinstance(key, int):
         return f"{parent_path}[{key}]"
-    else:
-        # Handle special characters in key names
-        if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', str(key)):
-            return f"{parent_path}.{key}"
-        else:
-            return f"{parent_path}['{key}']"
+    return parent_path + _key_segment(key)
+
+
+@lru_cache(maxsize=4096)
+def _key_segment(key: str) -> str:
+    """Format an object key as a path segment (payloads repeat the same keys)."""
+    # Handle special characters in key names: only ASCII identifiers
+    # ([a-zA-Z_][a-zA-Z0-9_]*) use dot notation
+    text = key if isinstance(key, str) else str(key)
+    if text.isascii() and text.isidentifier():
+        return f".{key}"
+    return f"['{key}']"
+
+
+_TYPE_NAMES = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
 
 
 def get_type_name(value: Any) -> str:
     """Get a friendly type name for a value."""
+    # JSON values are exact built-in types; subclasses take the chain below
+    name = _TYPE_NAMES.get(type(value))
+    if name is not None:
+        return name
+
     if value is None:
         return "null"
     elif isinstance(value, bool):
@@ -135,7 +313,7 @@ def get_type_name(value: Any) -> str:
 
 def values_equal(old: Any, new: Any) -> bool:
     """Check if two values are equal (handles type coercion for numbers)."""
-    if type(old) == type(new):
+    if type(old) is type(new):
         return old == new
 
     # Handle numeric comparison (int vs float)
@@ -150,15 +328,27 @@ def merge_dicts(base: dict, overlay: dict) -> dict:
     Deep merge two dictionaries.
     Overlay values override base values.
     """
-    result = deep_copy(base)
+    return _merge_into(_json_deepcopy(base), overlay)
+
 
+def _merge_into(dest: dict, overlay: dict) -> dict:
+    """Deep merge overlay into dest in place, copying only overlay values."""
     for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
+        if type(value) in _IMMUTABLE_TYPES:
+            # Scalars (most overlay values) replace whatever is there uncopied
+            dest[key] = value
+            continue
+
+        # A single get() serves absent keys too; merge_dicts mostly merges
+        # duplicate array items, whose keys are nearly all shared, so a
+        # separate 'key not in dest' test would slow the common case
+        current = dest.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge_into(current, value)
         else:
-            result[key] = deep_copy(value)
+            dest[key] = _json_deepcopy(value)
 
-    return result
+    return dest
 
 
 def extract_key_value(obj: dict, key_spec: str | list[str]) -> Optional[tuple]:
@@ -172,6 +362,16 @@ def extract_key_value(obj: dict, key_spec: str | list[str]) -> Optional[tuple]:
     Returns:
         Tuple of key values or None if any key is missing
     """
+    if type(obj) is dict:
+        # One lookup per key; a missing one raises instead of being probed
+        try:
+            if isinstance(key_spec, str):
+                return (obj[key_spec],)
+            return tuple([obj[key] for key in key_spec])
+        except KeyError:
+            return None
+
+    # Dict subclasses are probed first so __missing__ is never triggered
     if not isinstance(obj, dict):
         return None
 
@@ -185,10 +385,3 @@ def extract_key_value(obj: dict, key_spec: str | list[str]) -> Optional[tuple]:
         values.append(obj[key])
 
     return tuple(values)
-
-
-def format_key_value(key_value: tuple) -> str:
-    """Format a key value tuple for display."""
-    if len(key_value) == 1:
-        return repr(key_value[0])
-    return repr(key_value)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 """Simple script to test datasets with ShadowDiff engine."""
 
-import json
 import yaml
 from pathlib import Path
 
@@ -19,6 +18,7 @@ init_path.write_text(patched_init)
 
 try:
     from shadowdiff import ShadowDiffEngine
+    from shadowdiff.utils import loads_json
 
     # Load schema
     with open("schema.yaml") as f:
@@ -26,21 +26,23 @@ try:
 
     print("Schema loaded successfully\n")
 
+    # One engine for all datasets, so the resolved schema is reused
+    engine = ShadowDiffEngine()
+
     # Load and test each dataset
     datasets_dir = Path("datasets")
     for dataset_file in datasets_dir.glob("*.json"):
         print(f"Testing: {dataset_file.name}")
         print("-" * 40)
 
-        with open(dataset_file) as f:
-            dataset = json.load(f)
+        # orjson when installed, json for NaN/Infinity and ints beyond 64 bits
+        dataset = loads_json(dataset_file.read_bytes())
 
         before = dataset.get("before", {})
         after = dataset.get("after", {})
         expected = dataset.get("expected_match", True)
 
         # Run comparison
-        engine = ShadowDiffEngine()
         result = engine.compare(before, after, schema)
 
         if hasattr(result, 'is_match'):
@@ -1,7 +1,15 @@
 """Tests for ShadowDiff comparison engine."""
 
+import gc
+import io
+import json
+
 import pytest
 from shadowdiff import ShadowDiffEngine, EngineConfig, DiffType
+from shadowdiff.comparators import compile_rules, compare_with_rules, _compiled_comparators
+from shadowdiff.models import FieldRules, MigrationStrategy, _RULES_INTERN
+from shadowdiff.schema import RuleExtractor
+from shadowdiff.test_runner import GlobalReport, ScenarioResult, TestRunner as DatasetRunner
 
 
 class TestBasicComparison:
@@ -51,6 +59,26 @@ class TestBasicComparison:
         assert result.is_match is False
         assert any(d.type == DiffType.EXTRA_IN_NEW for d in result.diffs)
 
+    def test_equal_plain_subtree(self):
+        """Test equal rule-free subtrees match and still count their fields."""
+        schema = {"type": "object", "properties": {"meta": {"type": "object"}}}
+        old = {"meta": {"a": 1, "b": [1, 2, {"c": None}], "d": {}}}
+        new = {"meta": {"d": {}, "b": [1, 2, {"c": None}], "a": 1}}
+
+        result = self.engine.compare(old, new, schema)
+        assert result.is_match is True
+        assert result.summary.total_fields_checked == 4
+
+    def test_boolean_not_equal_to_integer(self):
+        """Test that true and 1 differ even though Python treats them as equal."""
+        schema = {"type": "object", "properties": {"meta": {"type": "object"}}}
+        old = {"meta": {"flag": True}}
+        new = {"meta": {"flag": 1}}
+
+        result = self.engine.compare(old, new, schema)
+        assert result.is_match is False
+        assert result.diffs[0].type == DiffType.TYPE_MISMATCH
+
 
 class TestMigrationStrategy:
     """Test x-migration-strategy extension."""
@@ -201,6 +229,21 @@ class TestStringComparison:
         assert result.is_match is False
         assert result.diffs[0].type == DiffType.PATTERN_MISMATCH
 
+    def test_pattern_must_match_whole_value(self):
+        """Test a pattern matching only a prefix of the value is a mismatch."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "code": {"type": "string", "x-migration-pattern": "\\d+"}
+            }
+        }
+        old = {"code": "123"}
+        new = {"code": "123abc"}
+
+        result = self.engine.compare(old, new, schema)
+        assert result.is_match is False
+        assert result.diffs[0].type == DiffType.PATTERN_MISMATCH
+
 
 class TestAliasMapping:
     """Test x-migration-alias extension."""
@@ -292,6 +335,56 @@ class TestArrayComparison:
         result = self.engine.compare(old, new, schema)
         assert result.is_match is True
 
+    def test_unordered_array_objects_and_tolerance(self):
+        """Test unordered matching of reordered objects and near-equal numbers."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "rows": {
+                    "type": "array",
+                    "x-migration-array-mode": "unordered",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "score": {"type": "number", "x-migration-precision": 0.1}
+                        }
+                    }
+                }
+            }
+        }
+        old = {"rows": [{"id": "a", "score": 1.0}, {"id": "b", "score": 2.0},
+                        {"id": "c", "score": 3.0}]}
+        new = {"rows": [{"score": 3.05, "id": "c"}, {"id": "a", "score": 1.0},
+                        {"id": "d", "score": 2.0}]}
+
+        result = self.engine.compare(old, new, schema)
+        assert result.is_match is False
+        assert sorted(d.path for d in result.diffs) == ["$.rows[1]", "$.rows[2]"]
+
+    def test_unordered_array_pairs_in_index_order(self):
+        """Test each old item pairs with the first matching new item, even near-equal."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "v": {
+                    "type": "array",
+                    "x-migration-array-mode": "unordered",
+                    "items": {"type": "number", "x-migration-precision": 0.1}
+                },
+                "w": {"type": "array", "x-migration-array-mode": "unordered"}
+            }
+        }
+        old = {"v": [1.0, 1.0, 1.3], "w": [{"a": 1.0}, {"a": 1}]}
+        new = {"v": [1.05, 1.0, 1.0], "w": [{"a": 1}]}
+
+        result = self.engine.compare(old, new, schema)
+        assert [(d.path, d.type) for d in result.diffs] == [
+            ("$.v[2]", DiffType.ARRAY_ITEM_MISSING),
+            ("$.v[2]", DiffType.ARRAY_ITEM_EXTRA),
+            ("$.w[1]", DiffType.ARRAY_ITEM_MISSING),
+        ]
+
     def test_keyed_array_mode(self):
         """Test keyed array comparison."""
         schema = {
@@ -336,6 +429,25 @@ class TestArrayComparison:
         assert result.is_match is True
         assert len(result.warnings) > 0
 
+    def test_numeric_array_precision(self):
+        """Test numeric arrays report only the items outside precision."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "values": {
+                    "type": "array",
+                    "items": {"type": "number", "x-migration-precision": 0.1}
+                }
+            }
+        }
+        old = {"values": [1, 2.0, 3, 4]}
+        new = {"values": [1.05, 2, 3.5, 4]}
+
+        result = self.engine.compare(old, new, schema)
+        assert result.is_match is False
+        assert [d.path for d in result.diffs] == ["$.values[2]"]
+        assert result.summary.total_fields_checked == 4
+
 
 class TestGlobalRules:
     """Test global migration rules."""
@@ -477,6 +589,87 @@ class TestTypeCasting:
         assert result.is_match is True
 
 
+class TestCompiledComparators:
+    """Test compiled comparator closures."""
+
+    def test_compiled_matches_interpreted(self):
+        """Test compiled comparators agree with compare_with_rules."""
+        rules = FieldRules(trim_whitespace=True, case_insensitive=True)
+        compiled = compile_rules(rules)
+
+        for old, new in [(" A ", "a"), ("a", "b"), (1, 1.0), (None, "x"), (None, None)]:
+            assert compiled(old, new) == compare_with_rules(old, new, rules)
+
+    def test_compiled_cached_per_rule_set(self):
+        """Test equivalent rule sets share one compiled comparator."""
+        assert compile_rules(FieldRules(precision=0.5)) is compile_rules(FieldRules(precision=0.5))
+
+    def test_compiled_cache_bounded(self):
+        """Test the compiled comparator cache drops the least recently used."""
+        for i in range(1000):
+            compile_rules(FieldRules(default=f"d{i}", has_default=True))
+        assert len(_compiled_comparators) <= 256
+
+    def test_equal_rules_interned(self):
+        """Test equal rule sets from different schema nodes share one object."""
+        node = {"type": "string", "x-migration-trim-whitespace": True}
+        first = RuleExtractor.extract_field_rules(dict(node))
+        second = RuleExtractor.extract_field_rules(dict(node))
+        assert first is second
+        assert RuleExtractor.extract_field_rules({"x-migration-default": 1}) is not \
+            RuleExtractor.extract_field_rules({"x-migration-default": True})
+
+    def test_interned_rules_released(self):
+        """Test interned rule sets are dropped once nothing uses them."""
+        for i in range(100):
+            RuleExtractor.extract_field_rules({"x-migration-default": "x" * i})
+        gc.collect()
+        assert len(_RULES_INTERN) < 100
+
+    def test_cached_defaults_keep_their_type(self):
+        """Test defaults that compare equal across types get separate comparators."""
+        compile_rules(FieldRules(default=1, has_default=True))
+        rules = FieldRules(default=True, has_default=True)
+        assert compile_rules(rules)(None, "True") == compare_with_rules(None, "True", rules)
+        assert compile_rules(rules)(None, "True")[0] is True
+
+    def test_lenient_strategy(self):
+        """Test lenient strategy trims and ignores case."""
+        compiled = compile_rules(FieldRules(strategy=MigrationStrategy.LENIENT))
+        assert compiled("  Hello ", "hello") == (True, "")
+
+    def test_nan_never_matches(self):
+        """Test NaN does not match itself (json.loads reuses one NaN object)."""
+        engine = ShadowDiffEngine()
+        schema = {"type": "object", "properties": {"a": {"type": "number"}}}
+        old = json.loads('{"a": NaN}')
+        new = json.loads('{"a": NaN}')
+
+        result = engine.compare(old, new, schema)
+        assert result.is_match is False
+        assert result.diffs[0].message == "Values differ: nan != nan"
+
+        nan = float("nan")
+        assert compile_rules(FieldRules())(nan, nan)[0] is False
+        assert compare_with_rules(nan, nan, FieldRules())[0] is False
+
+    def test_nan_array_with_precision(self):
+        """Test NaN elements of a number array mismatch under a precision."""
+        engine = ShadowDiffEngine()
+        schema = {
+            "type": "object",
+            "properties": {
+                "a": {"type": "array", "items": {"type": "number", "x-migration-precision": 0.01}}
+            }
+        }
+        old = json.loads('{"a": [NaN, 1, NaN]}')
+        new = json.loads('{"a": [NaN, 1, NaN]}')
+
+        result = engine.compare(old, new, schema)
+        assert result.is_match is False
+        assert [d.path for d in result.diffs] == ["$.a[0]", "$.a[2]"]
+
+
 class TestEngineConfig:
     """Test engine configuration options."""
 
@@ -517,6 +710,81 @@ class TestEngineConfig:
         result = engine.compare(old, new, schema)
         assert len(result.trace) > 0
 
+    def test_report_json_matches_dict(self):
+        """Test the JSON serialization carries the same document as to_dict."""
+        config = EngineConfig(trace_rule_application=True)
+        engine = ShadowDiffEngine(config)
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "amount": {"type": "number", "x-migration-precision": 0.01},
+                "name": {"type": "string"}
+            }
+        }
+        old = {"amount": 100.00, "name": "a", "gone": [1]}
+        new = {"amount": 100.5, "name": "b", "added": {"x": None}}
+
+        result = engine.compare(old, new, schema)
+        assert result.diffs
+        assert json.loads(result.to_json_bytes()) == result.to_dict()
+
+        # Values orjson would reject (ints beyond 64 bits) or write as null (NaN)
+        old = {"amount": float("nan"), "name": 2 ** 70}
+        new = {"amount": 1.0, "name": 2 ** 70 + 1}
+        result = engine.compare(old, new, schema)
+        assert result.diffs
+        assert json.dumps(json.loads(result.to_json_bytes())) == json.dumps(result.to_dict())
+        assert b"NaN" in result.to_json_bytes()
+
+    def test_schema_cache_bounded(self):
+        """Test the per-fragment schema cache stays small."""
+        engine = ShadowDiffEngine()
+        for _ in range(100):
+            engine.compare({"a": 1}, {"a": 1}, {"type": "object"})
+        assert len(engine._resolved_schemas) <= 16
+
+    def test_schema_traverser_caches_shared_per_node_only(self):
+        """Test compares share per-node rules but not per-path caches."""
+        engine = ShadowDiffEngine()
+        schema = {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "x-migration-array-mode": "keyed",
+                    "x-migration-array-key": "id",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "v": {"type": "number", "x-migration-precision": 0.1}
+                        }
+                    }
+                }
+            }
+        }
+        for i in range(50):
+            payload = {"items": [{"id": f"{i}-{j}", "v": j} for j in range(5)]}
+            assert engine.compare(payload, payload, schema).is_match is True
+
+        traverser = engine._resolved_schemas[id(schema)].traverser
+        assert traverser._rules_cache
+        assert len(traverser._schema_cache) <= 1
+        assert not traverser._segment_cache
+
+    def test_schema_mutated_between_compares(self):
+        """Test a schema changed in place is resolved again."""
+        engine = ShadowDiffEngine()
+        schema = {"type": "object", "properties": {"amount": {"type": "number"}}}
+        assert engine.compare({"amount": 1.0}, {"amount": 1.001}, schema).is_match is False
+
+        schema["properties"]["amount"]["x-migration-precision"] = 0.01
+        assert engine.compare({"amount": 1.0}, {"amount": 1.001}, schema).is_match is True
+
+        schema["properties"]["amount"]["x-migration-alias"] = "total"
+        assert engine.compare({"total": 1.0}, {"amount": 1.001}, schema).is_match is True
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -543,5 +811,61 @@ class TestErrorHandling:
         assert "PAYLOAD_SIZE_ERROR" in result.error["code"]
 
 
+class TestGlobalReport:
+    """Tests for the dataset-suite report."""
+
+    def test_write_json_matches_dict(self):
+        """Test the streamed JSON report carries the same document as to_dict."""
+        report = GlobalReport(total=2, passed=1, failed=1, timestamp="now")
+        report.scenarios = [
+            ScenarioResult("a", "a.json", True),
+            ScenarioResult("b", "b.json", False, diff_report={"diffs": [{"path": "$.x"}]}),
+        ]
+        buf = io.BytesIO()
+        report.write_json(buf)
+        assert json.loads(buf.getvalue()) == report.to_dict()
+
+        empty = io.BytesIO()
+        GlobalReport().write_json(empty)
+        assert json.loads(empty.getvalue())["scenarios"] == []
+
+    def test_write_json_nan_and_big_int_dataset(self, tmp_path):
+        """Test a dataset with NaN and an int beyond 64 bits is reported as json would."""
+        (tmp_path / "odd.json").write_text(
+            '{"before": {"a": NaN, "b": 123456789012345678901234567890},'
+            ' "after": {"a": 1.0, "b": 1}}'
+        )
+        schema = {"type": "object", "properties": {"a": {"type": "number"}, "b": {"type": "integer"}}}
+        report = DatasetRunner(schema).run_folder(str(tmp_path), print_report=False)
+
+        buf = io.BytesIO()
+        report.write_json(buf)
+        assert json.dumps(json.loads(buf.getvalue())) == json.dumps(report.to_dict())
+        diffs = json.loads(buf.getvalue())["scenarios"][0]["diff_report"]["diffs"]
+        assert {d["path"]: d["old_value"] for d in diffs}["$.b"] == 123456789012345678901234567890
+        assert b"NaN" in buf.getvalue()
+
+    def test_run_folder_logs_before_a_failing_file(self, tmp_path, capsys):
+        """Test PASS/FAIL lines already logged survive a later error."""
+        (tmp_path / "a.json").write_text('{"name": "first", "before": {}, "after": {}}')
+        (tmp_path / "b.json").write_text('{"before": ')
+        with pytest.raises(ValueError):
+            DatasetRunner({"type": "object"}).run_folder(str(tmp_path))
+        assert capsys.readouterr().out == "PASS: first\n"
+
+    def test_wide_int_dataset_loaded_exactly(self, tmp_path):
+        """Test an int beyond 64 bits in a dataset is not parsed into a float."""
+        (tmp_path / "wide.json").write_text(
+            '{"before": {"b": 123456789012345678901234567890, "c": -9223372036854775809},'
+            ' "after": {"b": 1, "c": 1}}'
+        )
+        schema = {"type": "object", "properties": {"b": {"type": "integer"}, "c": {"type": "integer"}}}
+        report = DatasetRunner(schema).run_folder(str(tmp_path), print_report=False)
+
+        diffs = report.scenarios[0].diff_report["diffs"]
+        old_values = {d["path"]: d["old_value"] for d in diffs}
+        assert old_values == {"$.b": 123456789012345678901234567890, "$.c": -9223372036854775809}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])